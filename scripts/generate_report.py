@@ -6,10 +6,54 @@ Usage:
 """
 
 import argparse
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
+from src.utilities.jsonio import read_json
+
+# Fallbacks for fields missing from a run summary.
+_ROW_DEFAULTS = {
+    "run_id": "N/A",
+    "scenario": "N/A",
+    "total_requests": 0,
+    "total_failures": 0,
+    "avg_response_time_ms": 0,
+    "p95_response_time_ms": 0,
+    "p99_response_time_ms": 0,
+    "rps": 0,
+    "pass_fail": "UNKNOWN",
+}
+
+_HTML_ROW = """
+            <tr class="{status_class}">
+                <td>{run_id}</td>
+                <td>{scenario}</td>
+                <td>{total_requests:,}</td>
+                <td>{total_failures:,}</td>
+                <td>{avg_response_time_ms:.2f} ms</td>
+                <td>{p95_response_time_ms:.2f} ms</td>
+                <td>{p99_response_time_ms:.2f} ms</td>
+                <td>{rps:.2f}</td>
+                <td class="{status_class}">{pass_fail}</td>
+            </tr>
+        """
+
+
+_MD_ROW = (
+    "| {run_id} | {scenario} | {total_requests:,} | {total_failures:,} | "
+    "{avg_response_time_ms:.2f}ms | {p95_response_time_ms:.2f}ms | "
+    "{p99_response_time_ms:.2f}ms | {rps:.2f} | {status_icon} {pass_fail} |"
+)
+
+
+class _SummaryRow(dict):
+    """Run summary that falls back to report defaults for missing fields."""
+
+    def __missing__(self, key):
+        return _ROW_DEFAULTS[key]
+
 
 def load_run_summary(run_id: str, reports_dir: Path) -> dict:
     """Load a run summary by ID."""
@@ -19,39 +63,35 @@ def load_run_summary(run_id: str, reports_dir: Path) -> dict:
         summary_file = reports_dir / f"{run_id}.json"
 
     if summary_file.exists():
-        with open(summary_file) as f:
-            return json.load(f)
+        return read_json(summary_file)
     return None
 
 
 def find_all_runs(reports_dir: Path) -> list[str]:
     """Find all run summary files."""
+    if not reports_dir.is_dir():
+        return []
+
+    prefix, suffix = "run-summary-", ".json"
     runs = []
-    for f in reports_dir.glob("run-summary-*.json"):
-        # Extract run_id from filename
-        run_id = f.stem.replace("run-summary-", "")
-        runs.append(run_id)
-    return sorted(runs)
+    with os.scandir(reports_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith(prefix) and name.endswith(suffix) and entry.is_file():
+                # Extract run_id from filename
+                runs.append(name[len(prefix) : -len(suffix)])
+    runs.sort()
+    return runs
 
 
 def generate_html_report(summaries: list[dict], output_path: Path):
     """Generate HTML combined report."""
-    rows = []
-    for s in summaries:
-        status_class = "pass" if s.get("pass_fail") == "PASS" else "fail"
-        rows.append(f"""
-            <tr class="{status_class}">
-                <td>{s.get("run_id", "N/A")}</td>
-                <td>{s.get("scenario", "N/A")}</td>
-                <td>{s.get("total_requests", 0):,}</td>
-                <td>{s.get("total_failures", 0):,}</td>
-                <td>{s.get("avg_response_time_ms", 0):.2f} ms</td>
-                <td>{s.get("p95_response_time_ms", 0):.2f} ms</td>
-                <td>{s.get("p99_response_time_ms", 0):.2f} ms</td>
-                <td>{s.get("rps", 0):.2f}</td>
-                <td class="{status_class}">{s.get("pass_fail", "UNKNOWN")}</td>
-            </tr>
-        """)
+    rows = "".join(
+        _HTML_ROW.format_map(
+            _SummaryRow(s, status_class="pass" if s.get("pass_fail") == "PASS" else "fail")
+        )
+        for s in summaries
+    )
 
     html = f"""<!DOCTYPE html>
 <html>
@@ -134,15 +174,14 @@ def generate_html_report(summaries: list[dict], output_path: Path):
             </tr>
         </thead>
         <tbody>
-            {"".join(rows)}
+            {rows}
         </tbody>
     </table>
 </body>
 </html>"""
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write(html)
+    output_path.write_text(html, encoding="utf-8")
 
 
 def generate_markdown_report(summaries: list[dict], output_path: Path):
@@ -161,21 +200,15 @@ def generate_markdown_report(summaries: list[dict], output_path: Path):
         "|--------|----------|----------|----------|-------------|-----|-----|-----|--------|",
     ]
 
-    for s in summaries:
-        status = s.get("pass_fail", "UNKNOWN")
-        status_icon = "✅" if status == "PASS" else "❌"
-        lines.append(
-            f"| {s.get('run_id', 'N/A')} | {s.get('scenario', 'N/A')} | "
-            f"{s.get('total_requests', 0):,} | {s.get('total_failures', 0):,} | "
-            f"{s.get('avg_response_time_ms', 0):.2f}ms | "
-            f"{s.get('p95_response_time_ms', 0):.2f}ms | "
-            f"{s.get('p99_response_time_ms', 0):.2f}ms | "
-            f"{s.get('rps', 0):.2f} | {status_icon} {status} |"
+    lines.extend(
+        _MD_ROW.format_map(
+            _SummaryRow(s, status_icon="✅" if s.get("pass_fail") == "PASS" else "❌")
         )
+        for s in summaries
+    )
 
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_path, "w") as f:
-        f.write("\n".join(lines))
+    output_path.write_text("\n".join(lines), encoding="utf-8")
 
 
 def main():
@@ -217,10 +250,11 @@ def main():
 
     print(f"Found {len(run_ids)} runs to include in report")
 
-    # Load summaries
+    # Load summaries concurrently so file reads overlap; map() keeps run order
     summaries = []
-    for run_id in run_ids:
-        summary = load_run_summary(run_id, reports_dir)
+    with ThreadPoolExecutor(max_workers=min(32, max(1, len(run_ids)))) as pool:
+        loaded = list(pool.map(lambda run_id: load_run_summary(run_id, reports_dir), run_ids))
+    for run_id, summary in zip(run_ids, loaded, strict=True):
         if summary:
             summaries.append(summary)
         else:
@@ -8,22 +8,41 @@ Usage:
 import argparse
 import json
 import random
-import uuid
+from collections import Counter
+from collections.abc import Iterator
+from os import urandom
 from pathlib import Path
 
-
-def generate_rule(seed: int = None, rule_type: str = "PREAUTH") -> dict:
-    """Generate a single synthetic rule."""
-    if seed:
-        random.seed(seed)
+from src.utilities.jsonio import RecordWriter
+
+# Shared string constants so every generated record references the same objects.
+_CREATED_AT = "2026-01-01T00:00:00Z"
+_VERSION = "1.0.0"
+_RULE_TYPES = ("PREAUTH", "POSTAUTH")
+_STATUSES = ("draft", "active", "archived")
+_PREAUTH_FIELDS = ("amount", "velocity", "country", "merchant_risk")
+_PREAUTH_OPERATORS = (">", "<", "==", "in", "not in")
+_PREAUTH_ACTIONS = ("decline", "review", "3ds", "allow")
+_POSTAUTH_FIELDS = ("chargeback_ratio", "amount", "time_since_auth")
+_POSTAUTH_OPERATORS = (">", "<")
+_POSTAUTH_VALUES = (0.02, 5000, 86400)
+_POSTAUTH_ACTIONS = ("flag", "review", "notify")
+
+
+def generate_rule(
+    seed: int = None, rule_type: str = "PREAUTH", rng: random.Random | None = None
+) -> dict:
+    """Generate a single synthetic rule, drawing from rng when given."""
+    if rng is None:
+        rng = random.Random(seed)
 
     # Condition templates based on rule type
     if rule_type == "PREAUTH":
         conditions = [
             {
-                "field": random.choice(["amount", "velocity", "country", "merchant_risk"]),
-                "operator": random.choice([">", "<", "==", "in", "not in"]),
-                "value": random.choice(
+                "field": rng.choice(_PREAUTH_FIELDS),
+                "operator": rng.choice(_PREAUTH_OPERATORS),
+                "value": rng.choice(
                     [
                         1000,
                         5000,
@@ -35,51 +54,51 @@ def generate_rule(seed: int = None, rule_type: str = "PREAUTH") -> dict:
         ]
         actions = [
             {
-                "type": random.choice(["decline", "review", "3ds", "allow"]),
+                "type": rng.choice(_PREAUTH_ACTIONS),
                 "reason": "Automated rule generated for load testing",
             }
         ]
     else:  # POSTAUTH
         conditions = [
             {
-                "field": random.choice(["chargeback_ratio", "amount", "time_since_auth"]),
-                "operator": random.choice([">", "<"]),
-                "value": random.choice([0.02, 5000, 86400]),
+                "field": rng.choice(_POSTAUTH_FIELDS),
+                "operator": rng.choice(_POSTAUTH_OPERATORS),
+                "value": rng.choice(_POSTAUTH_VALUES),
             }
         ]
         actions = [
             {
-                "type": random.choice(["flag", "review", "notify"]),
+                "type": rng.choice(_POSTAUTH_ACTIONS),
                 "reason": "Post-auth analysis rule",
             }
         ]
 
     return {
-        "rule_id": f"rule_{uuid.uuid4().hex[:12]}",
-        "name": f"Load Test Rule {random.randint(1000, 9999)}",
+        "rule_id": f"rule_{urandom(6).hex()}",
+        "name": f"Load Test Rule {rng.randint(1000, 9999)}",
         "description": f"Generated {rule_type} rule for load testing",
         "rule_type": rule_type,
-        "priority": random.randint(1, 100),
-        "status": random.choice(["draft", "active", "archived"]),
+        "priority": rng.randint(1, 100),
+        "status": rng.choice(_STATUSES),
         "conditions": conditions,
         "actions": actions,
-        "created_at": "2026-01-01T00:00:00Z",
-        "version": "1.0.0",
+        "created_at": _CREATED_AT,
+        "version": _VERSION,
     }
 
 
-def generate_rules(count: int, seed: int = None, rule_type: str = None) -> list[dict]:
-    """Generate a batch of synthetic rules."""
-    if seed:
-        random.seed(seed)
+def iter_rules(count: int, seed: int = None, rule_type: str = None) -> Iterator[dict]:
+    """Yield synthetic rules one at a time."""
+    rng = random.Random(seed)
 
-    rules = []
-    for i in range(count):
-        rt = rule_type if rule_type else random.choice(["PREAUTH", "POSTAUTH"])
-        rule = generate_rule(seed=seed + i if seed else None, rule_type=rt)
-        rules.append(rule)
+    for _ in range(count):
+        rt = rule_type if rule_type else rng.choice(_RULE_TYPES)
+        yield generate_rule(rule_type=rt, rng=rng)
 
-    return rules
+
+def generate_rules(count: int, seed: int = None, rule_type: str = None) -> list[dict]:
+    """Generate a batch of synthetic rules."""
+    return list(iter_rules(count, seed=seed, rule_type=rule_type))
 
 
 def main():
@@ -94,38 +113,51 @@ def main():
         help="Rule type (default: random mix)",
     )
     parser.add_argument(
-        "--output", type=str, default="fixtures/rules.json", help="Output file path"
+        "--output",
+        type=str,
+        default=None,
+        help="Output file path (default: fixtures/rules.<format>)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        help="Output format: a single JSON array (json) or one record per line (jsonl)",
+    )
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent JSON array output for human reading"
     )
 
     args = parser.parse_args()
 
     print(f"Generating {args.count} rules...")
-    rules = generate_rules(args.count, seed=args.seed, rule_type=args.rule_type)
 
     # Ensure output directory exists
-    output_path = Path(args.output)
+    output_path = Path(args.output or f"fixtures/rules.{args.format}")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(rules, f, indent=2)
+    # Stream to file, tallying the summary as records go by
+    type_counts = Counter()
+    sample = None
+    with RecordWriter(output_path, jsonl=args.format == "jsonl", indent=args.pretty) as writer:
+        for rule in iter_rules(args.count, seed=args.seed, rule_type=args.rule_type):
+            writer.write(rule)
+            type_counts[rule["rule_type"]] += 1
+            if sample is None:
+                sample = rule
 
-    print(f"Generated {len(rules)} rules -> {output_path}")
+    print(f"Generated {writer.count} rules -> {output_path}")
 
     # Print type summary
-    type_counts = {}
-    for rule in rules:
-        rt = rule["rule_type"]
-        type_counts[rt] = type_counts.get(rt, 0) + 1
-
     print("\nRule type summary:")
     for rt, count in sorted(type_counts.items()):
-        pct = count / len(rules) * 100
+        pct = count / writer.count * 100
         print(f"  {rt}: {count} ({pct:.1f}%)")
 
     # Print sample
-    print("\nSample rule:")
-    print(json.dumps(rules[0], indent=2))
+    if sample is not None:
+        print("\nSample rule:")
+        print(json.dumps(sample, indent=2))
 
 
 if __name__ == "__main__":
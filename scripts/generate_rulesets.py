@@ -8,33 +8,49 @@ Usage:
 import argparse
 import json
 import random
-import uuid
+from collections import Counter
+from collections.abc import Iterator
+from os import urandom
 from pathlib import Path
 
+from src.utilities.jsonio import RecordWriter, iter_records
+
+# Shared string constants so every generated record references the same objects.
+_CREATED_AT = "2026-01-01T00:00:00Z"
+_STATUSES = ("draft", "published", "archived")
+
 
 def generate_ruleset(
-    seed: int = None, ruleset_size: int = 20, available_rules: list[str] = None
+    seed: int = None,
+    ruleset_size: int = 20,
+    available_rules: tuple[str, ...] = None,
+    rng: random.Random | None = None,
 ) -> dict:
-    """Generate a single synthetic ruleset."""
-    if seed:
-        random.seed(seed)
+    """Generate a single synthetic ruleset, drawing from rng when given."""
+    if rng is None:
+        rng = random.Random(seed)
 
     if available_rules:
-        # Sample from available rules
-        selected_rules = random.sample(available_rules, min(ruleset_size, len(available_rules)))
+        if ruleset_size >= len(available_rules):
+            # Every rule is selected; only the order needs randomizing
+            selected_rules = list(available_rules)
+            rng.shuffle(selected_rules)
+        else:
+            # Sample from available rules
+            selected_rules = rng.sample(available_rules, ruleset_size)
     else:
         # Generate synthetic rule IDs
-        selected_rules = [f"rule_{uuid.uuid4().hex[:12]}" for _ in range(ruleset_size)]
+        selected_rules = [f"rule_{urandom(6).hex()}" for _ in range(ruleset_size)]
 
     return {
-        "ruleset_id": f"rs_{uuid.uuid4().hex[:12]}",
-        "name": f"Load Test Ruleset {random.randint(1000, 9999)}",
+        "ruleset_id": f"rs_{urandom(6).hex()}",
+        "name": f"Load Test Ruleset {rng.randint(1000, 9999)}",
         "description": "Generated ruleset for load testing",
-        "version": f"{random.randint(1, 5)}.{random.randint(0, 9)}.{random.randint(0, 9)}",
+        "version": f"{rng.randint(1, 5)}.{rng.randint(0, 9)}.{rng.randint(0, 9)}",
         "rules": selected_rules,
-        "status": random.choice(["draft", "published", "archived"]),
-        "created_at": "2026-01-01T00:00:00Z",
-        "activation_date": "2026-01-01T00:00:00Z" if random.random() > 0.3 else None,
+        "status": rng.choice(_STATUSES),
+        "created_at": _CREATED_AT,
+        "activation_date": _CREATED_AT if rng.random() > 0.3 else None,
         "metadata": {
             "owner": "load-test",
             "tags": ["generated", "test"],
@@ -42,28 +58,28 @@ def generate_ruleset(
     }
 
 
+def iter_rulesets(
+    count: int, seed: int = None, ruleset_size: int = 20, available_rules: tuple[str, ...] = None
+) -> Iterator[dict]:
+    """Yield synthetic rulesets one at a time."""
+    rng = random.Random(seed)
+
+    for _ in range(count):
+        yield generate_ruleset(ruleset_size=ruleset_size, available_rules=available_rules, rng=rng)
+
+
 def generate_rulesets(
-    count: int, seed: int = None, ruleset_size: int = 20, available_rules: list[str] = None
+    count: int, seed: int = None, ruleset_size: int = 20, available_rules: tuple[str, ...] = None
 ) -> list[dict]:
     """Generate a batch of synthetic rulesets."""
-    if seed:
-        random.seed(seed)
-
-    return [
-        generate_ruleset(
-            seed=seed + i if seed else None,
-            ruleset_size=ruleset_size,
-            available_rules=available_rules,
-        )
-        for i in range(count)
-    ]
+    return list(
+        iter_rulesets(count, seed=seed, ruleset_size=ruleset_size, available_rules=available_rules)
+    )
 
 
-def load_rules_from_file(rules_file: str) -> list[str]:
-    """Load rule IDs from a rules file."""
-    with open(rules_file) as f:
-        rules = json.load(f)
-    return [r["rule_id"] for r in rules]
+def load_rules_from_file(rules_file: str) -> tuple[str, ...]:
+    """Load rule IDs from a rules file (JSON array or JSON Lines)."""
+    return tuple(r["rule_id"] for r in iter_records(rules_file))
 
 
 def main():
@@ -72,10 +88,25 @@ def main():
     parser.add_argument("--rules-per-set", type=int, default=20, help="Number of rules per ruleset")
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
     parser.add_argument(
-        "--rules-file", type=str, default=None, help="Path to rules.json to sample from (optional)"
+        "--rules-file",
+        type=str,
+        default=None,
+        help="Path to rules.json or rules.jsonl to sample from (optional)",
     )
     parser.add_argument(
-        "--output", type=str, default="fixtures/rulesets.json", help="Output file path"
+        "--output",
+        type=str,
+        default=None,
+        help="Output file path (default: fixtures/rulesets.<format>)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="json",
+        help="Output format: a single JSON array (json) or one record per line (jsonl)",
+    )
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent JSON array output for human reading"
     )
 
     args = parser.parse_args()
@@ -88,34 +119,38 @@ def main():
         print(f"Loaded {len(available_rules)} rules")
 
     print(f"Generating {args.count} rulesets with {args.rules_per_set} rules each...")
-    rulesets = generate_rulesets(
-        args.count, seed=args.seed, ruleset_size=args.rules_per_set, available_rules=available_rules
-    )
 
     # Ensure output directory exists
-    output_path = Path(args.output)
+    output_path = Path(args.output or f"fixtures/rulesets.{args.format}")
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(rulesets, f, indent=2)
+    # Stream to file, tallying the summary as records go by
+    status_counts = Counter()
+    sample = None
+    with RecordWriter(output_path, jsonl=args.format == "jsonl", indent=args.pretty) as writer:
+        for rs in iter_rulesets(
+            args.count,
+            seed=args.seed,
+            ruleset_size=args.rules_per_set,
+            available_rules=available_rules,
+        ):
+            writer.write(rs)
+            status_counts[rs["status"]] += 1
+            if sample is None:
+                sample = rs
 
-    print(f"Generated {len(rulesets)} rulesets -> {output_path}")
+    print(f"Generated {writer.count} rulesets -> {output_path}")
 
     # Print status summary
-    status_counts = {}
-    for rs in rulesets:
-        status = rs["status"]
-        status_counts[status] = status_counts.get(status, 0) + 1
-
     print("\nStatus summary:")
     for status, count in sorted(status_counts.items()):
-        pct = count / len(rulesets) * 100
+        pct = count / writer.count * 100
         print(f"  {status}: {count} ({pct:.1f}%)")
 
     # Print sample
-    print("\nSample ruleset:")
-    print(json.dumps(rulesets[0], indent=2))
+    if sample is not None:
+        print("\nSample ruleset:")
+        print(json.dumps(sample, indent=2))
 
 
 if __name__ == "__main__":
@@ -2,16 +2,25 @@
 CLI script to generate test transaction data.
 
 Usage:
-    uv run gen-transactions --count=10000 --output=fixtures/transactions.json
+    uv run gen-transactions --count=10000 --output=fixtures/transactions.jsonl
+    uv run gen-transactions --count=10000 --format=json
 """
 
 import argparse
 import json
+import os
 import random
-import uuid
+import sys
+from collections.abc import Iterator
 from datetime import UTC, datetime
+from functools import partial
+from os import urandom
 from pathlib import Path
 
+import numpy as np
+
+from src.utilities.record_shards import write_records
+
 try:
     from faker import Faker
 
@@ -19,48 +28,65 @@ try:
 except ImportError:
     fake = None
 
-
-def generate_transaction(seed: int = None, country: str = None, risk_level: str = "normal") -> dict:
-    """Generate a single synthetic transaction."""
-    if seed:
-        random.seed(seed)
+# Categorical vocabularies shared by the single-record and batch generators.
+_AMOUNT_RANGES = {
+    "normal": (100, 5000),
+    "high": (5000, 50000),
+    "suspicious": (50000, 500000),
+}
+_COUNTRY_CURRENCY = {
+    "IN": "INR",
+    "US": "USD",
+    "SG": "SGD",
+    "GB": "GBP",
+    "AU": "AUD",
+}
+_COUNTRIES = tuple(_COUNTRY_CURRENCY)
+_CARD_BINS = ("4111", "5411", "3700", "4000")
+_CARD_NETWORKS = ("VISA", "MASTERCARD", "AMEX")
+_MCCS = ("5411", "5812", "4111", "7995", "5311", "5412", "5541")
+
+# Records sampled per NumPy batch when streaming.
+_BATCH_SIZE = 10_000
+
+# Counts at or above this are split across worker processes. Records are built in
+# NumPy batches, so smaller counts finish before a process pool would start.
+_PARALLEL_MIN_COUNT = 100_000
+
+
+def generate_transaction(
+    seed: int = None,
+    country: str = None,
+    risk_level: str = "normal",
+    occurred_at: str | None = None,
+    rng: random.Random | None = None,
+) -> dict:
+    """Generate a single synthetic transaction, drawing from rng when given."""
+    if rng is None:
+        rng = random.Random(seed)
 
     # Amount distribution based on risk level
-    amount_ranges = {
-        "normal": (100, 5000),
-        "high": (5000, 50000),
-        "suspicious": (50000, 500000),
-    }
-
-    amount = round(random.uniform(*amount_ranges[risk_level]), 2)
+    amount = round(rng.uniform(*_AMOUNT_RANGES[risk_level]), 2)
 
     # Country and currency correlation
-    country_currency = {
-        "IN": "INR",
-        "US": "USD",
-        "SG": "SGD",
-        "GB": "GBP",
-        "AU": "AUD",
-    }
-
     if not country:
-        country = random.choice(list(country_currency.keys()))
-    currency = country_currency.get(country, "USD")
+        country = rng.choice(_COUNTRIES)
+    currency = _COUNTRY_CURRENCY.get(country, "USD")
 
     # Card masking
-    card_bin = random.choice(["4111", "5411", "3700", "4000"])
-    card_last4 = str(random.randint(1000, 9999))
+    card_bin = rng.choice(_CARD_BINS)
+    card_last4 = str(rng.randint(1000, 9999))
     card_id = f"{card_bin}{'*' * 8}{card_last4}"
 
     return {
-        "transaction_id": f"txn_{uuid.uuid4().hex[:16]}",
-        "occurred_at": datetime.now(UTC).isoformat(),
+        "transaction_id": f"txn_{urandom(8).hex()}",
+        "occurred_at": occurred_at or datetime.now(UTC).isoformat(),
         "card_id": card_id,
         "card_last4": card_last4,
-        "card_network": random.choice(["VISA", "MASTERCARD", "AMEX"]),
-        "merchant_id": f"M{random.randint(10000, 99999)}",
-        "mcc": random.choice(["5411", "5812", "4111", "7995", "5311", "5412", "5541"]),
-        "ip": fake.ipv4() if fake else f"192.168.{random.randint(0, 255)}.{random.randint(1, 254)}",
+        "card_network": rng.choice(_CARD_NETWORKS),
+        "merchant_id": f"M{rng.randint(10000, 99999)}",
+        "mcc": rng.choice(_MCCS),
+        "ip": fake.ipv4() if fake else f"192.168.{rng.randint(0, 255)}.{rng.randint(1, 254)}",
         "amount": amount,
         "currency": currency,
         "country": country,
@@ -68,32 +94,92 @@ def generate_transaction(seed: int = None, country: str = None, risk_level: str
     }
 
 
-def generate_transactions(
-    count: int, seed: int = None, distribution: dict[str, float] = None
-) -> list[dict]:
-    """Generate transactions with specified risk distribution."""
+def iter_transactions(
+    count: int,
+    seed: int = None,
+    distribution: dict[str, float] = None,
+    batch_size: int = _BATCH_SIZE,
+) -> Iterator[dict]:
+    """
+    Yield transactions with specified risk distribution.
+
+    Fields are sampled with NumPy one batch at a time and the records are
+    assembled from the parallel arrays, so memory stays bounded by batch_size
+    regardless of count.
+    """
     if distribution is None:
         distribution = {"normal": 0.8, "high": 0.15, "suspicious": 0.05}
 
-    if seed:
-        random.seed(seed)
-
-    transactions = []
-    for i in range(count):
-        # Determine risk level based on distribution
-        rand = random.random()
-        cumulative = 0
-        risk_level = "normal"
-        for level, prob in distribution.items():
-            cumulative += prob
-            if rand <= cumulative:
-                risk_level = level
-                break
+    rng = np.random.default_rng(seed)
+
+    # Intern level names (often parsed from the CLI) so records share one object each.
+    levels = [sys.intern(level) for level in distribution]
+    # Cumulative distribution, computed once; each batch bisects it in one call.
+    cdf = np.cumsum(np.array(list(distribution.values()), dtype=float))
+    cdf /= cdf[-1]
+    last_level = len(levels) - 1
+    low = np.array([_AMOUNT_RANGES[level][0] for level in levels], dtype=float)
+    high = np.array([_AMOUNT_RANGES[level][1] for level in levels], dtype=float)
+
+    # Synthetic rows don't need distinct timestamps; read the clock once per call.
+    occurred_at = datetime.now(UTC).isoformat()
+
+    for offset in range(0, count, batch_size):
+        size = min(batch_size, count - offset)
+
+        # Determine risk levels based on distribution
+        risk_idx = np.minimum(np.searchsorted(cdf, rng.random(size)), last_level)
+
+        # Amount distribution based on risk level
+        amounts = np.round(rng.uniform(low[risk_idx], high[risk_idx]), 2).tolist()
+
+        countries = rng.integers(0, len(_COUNTRIES), size=size).tolist()
+        bins = rng.integers(0, len(_CARD_BINS), size=size).tolist()
+        last4s = rng.integers(1000, 10000, size=size).tolist()
+        networks = rng.integers(0, len(_CARD_NETWORKS), size=size).tolist()
+        merchants = rng.integers(10000, 100000, size=size).tolist()
+        mccs = rng.integers(0, len(_MCCS), size=size).tolist()
+        octets = rng.integers(1, 255, size=(size, 4)).tolist()
+        # One urandom read per batch; each transaction takes a 16-char slice.
+        id_hex = urandom(8 * size).hex()
+        txn_ids = [id_hex[j : j + 16] for j in range(0, 16 * size, 16)]
+
+        for txn_id, risk, amount, c, b, last4, network, merchant, mcc, ip in zip(
+            txn_ids,
+            risk_idx.tolist(),
+            amounts,
+            countries,
+            bins,
+            last4s,
+            networks,
+            merchants,
+            mccs,
+            octets,
+            strict=True,
+        ):
+            country = _COUNTRIES[c]
+            card_last4 = str(last4)
+            yield {
+                "transaction_id": f"txn_{txn_id}",
+                "occurred_at": occurred_at,
+                "card_id": f"{_CARD_BINS[b]}{'*' * 8}{card_last4}",
+                "card_last4": card_last4,
+                "card_network": _CARD_NETWORKS[network],
+                "merchant_id": f"M{merchant}",
+                "mcc": _MCCS[mcc],
+                "ip": "{}.{}.{}.{}".format(*ip),
+                "amount": amount,
+                "currency": _COUNTRY_CURRENCY[country],
+                "country": country,
+                "risk_level": levels[risk],
+            }
 
-        txn = generate_transaction(seed=seed + i if seed else None, risk_level=risk_level)
-        transactions.append(txn)
 
-    return transactions
+def generate_transactions(
+    count: int, seed: int = None, distribution: dict[str, float] = None
+) -> list[dict]:
+    """Generate transactions with specified risk distribution."""
+    return list(iter_transactions(count, seed=seed, distribution=distribution))
 
 
 def main():
@@ -103,7 +189,10 @@ def main():
     )
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
     parser.add_argument(
-        "--output", type=str, default="fixtures/transactions.json", help="Output file path"
+        "--output",
+        type=str,
+        default=None,
+        help="Output file path (default: fixtures/transactions.<format>)",
     )
     parser.add_argument(
         "--distribution",
@@ -111,6 +200,21 @@ def main():
         default="normal:0.8,high:0.15,suspicious:0.05",
         help="Risk level distribution (format: level:prob,level:prob)",
     )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="jsonl",
+        help="Output format: one record per line (jsonl) or a single JSON array (json)",
+    )
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent JSON array output for human reading"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=f"Worker processes for counts of {_PARALLEL_MIN_COUNT:,} or more",
+    )
 
     args = parser.parse_args()
 
@@ -123,32 +227,38 @@ def main():
     print(f"Generating {args.count} transactions...")
     print(f"Distribution: {distribution}")
 
-    transactions = generate_transactions(args.count, seed=args.seed, distribution=distribution)
-
     # Ensure output directory exists
-    output_path = Path(args.output)
+    output_path = Path(args.output or f"fixtures/transactions.{args.format}")
+    jsonl = args.format == "jsonl"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(transactions, f, indent=2)
+    # Stream to file, tallying the summary as records go by
+    workers = args.workers if args.count >= _PARALLEL_MIN_COUNT else 1
+    if workers > 1:
+        print(f"Using {workers} worker processes")
+    written, risk_counts, sample = write_records(
+        output_path,
+        partial(iter_transactions, distribution=distribution),
+        args.count,
+        args.seed,
+        jsonl,
+        args.pretty,
+        workers=workers,
+        tally="risk_level",
+    )
 
-    print(f"Generated {len(transactions)} transactions -> {output_path}")
+    print(f"Generated {written} transactions -> {output_path}")
 
     # Print distribution summary
-    risk_counts = {}
-    for txn in transactions:
-        level = txn["risk_level"]
-        risk_counts[level] = risk_counts.get(level, 0) + 1
-
     print("\nDistribution summary:")
     for level, count in sorted(risk_counts.items()):
-        pct = count / len(transactions) * 100
+        pct = count / written * 100
         print(f"  {level}: {count} ({pct:.1f}%)")
 
     # Print sample
-    print("\nSample transaction:")
-    print(json.dumps(transactions[0], indent=2))
+    if sample is not None:
+        print("\nSample transaction:")
+        print(json.dumps(sample, indent=2))
 
 
 if __name__ == "__main__":
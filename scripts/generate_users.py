@@ -2,57 +2,84 @@
 CLI script to generate test user data.
 
 Usage:
-    uv run gen-users --count=1000 --output=fixtures/users.json
+    uv run gen-users --count=1000 --output=fixtures/users.jsonl
+    uv run gen-users --count=1000 --format=json
 """
 
 import argparse
 import json
+import os
 import random
-import uuid
+from collections.abc import Iterator
+from functools import partial
+from os import urandom
 from pathlib import Path
 
+from src.utilities.record_shards import write_records
+
 try:
     from faker import Faker
+
+    # Faker construction is expensive; share one instance across all users.
+    fake = Faker()
 except ImportError:
-    Faker = None
+    fake = None
+
+# Counts at or above this are split across worker processes. Faker makes a user
+# roughly 100x slower to build than a transaction, so the pool pays for its
+# startup at a tenth of gen-transactions' threshold.
+_PARALLEL_MIN_COUNT = 10_000
+
+# Shared string constants so every generated record references the same objects.
+_CREATED_AT = "2026-01-01T00:00:00Z"
+_COUNTRIES = ("IN", "US", "SG", "GB", "AU")
+_KYC_STATUSES = ("verified", "pending", "unverified")
 
 
-def generate_user(seed: int = None, country: str = None) -> dict:
-    """Generate a single synthetic user."""
-    if Faker:
-        fake = Faker()
-        if seed:
-            Faker.seed(seed)
+def generate_user(seed: int = None, country: str = None, rng: random.Random | None = None) -> dict:
+    """Generate a single synthetic user, drawing from rng when given."""
+    if rng is None:
+        rng = random.Random(seed)
+        if fake and seed is not None:
+            fake.seed_instance(seed)
 
+    if fake:
         first_name = fake.first_name()
         last_name = fake.last_name()
         email = fake.email()
     else:
-        first_name = f"User{random.randint(1000, 9999)}"
-        last_name = f"Test{random.randint(1000, 9999)}"
+        first_name = f"User{rng.randint(1000, 9999)}"
+        last_name = f"Test{rng.randint(1000, 9999)}"
         email = f"{first_name.lower()}.{last_name.lower()}@example.com"
 
     if not country:
-        country = random.choice(["IN", "US", "SG", "GB", "AU"])
+        country = rng.choice(_COUNTRIES)
 
     return {
-        "user_id": f"user_{uuid.uuid4().hex[:16]}",
+        "user_id": f"user_{urandom(8).hex()}",
         "first_name": first_name,
         "last_name": last_name,
         "email": email,
         "country": country,
-        "created_at": "2026-01-01T00:00:00Z",
-        "kyc_status": random.choice(["verified", "pending", "unverified"]),
-        "risk_score": random.randint(0, 100),
+        "created_at": _CREATED_AT,
+        "kyc_status": rng.choice(_KYC_STATUSES),
+        "risk_score": rng.randint(0, 100),
     }
 
 
+def iter_users(count: int, seed: int = None, country: str = None) -> Iterator[dict]:
+    """Yield synthetic users one at a time."""
+    rng = random.Random(seed)
+    if fake and seed is not None:
+        fake.seed_instance(seed)
+
+    for _ in range(count):
+        yield generate_user(country=country, rng=rng)
+
+
 def generate_users(count: int, seed: int = None, country: str = None) -> list[dict]:
     """Generate a batch of synthetic users."""
-    if seed:
-        random.seed(seed)
-
-    return [generate_user(seed=seed + i if seed else None, country=country) for i in range(count)]
+    return list(iter_users(count, seed=seed, country=country))
 
 
 def main():
@@ -61,27 +88,56 @@ def main():
     parser.add_argument("--seed", type=int, default=42, help="Random seed for reproducibility")
     parser.add_argument("--country", type=str, default=None, help="Filter by country (IN, US, SG)")
     parser.add_argument(
-        "--output", type=str, default="fixtures/users.json", help="Output file path"
+        "--output",
+        type=str,
+        default=None,
+        help="Output file path (default: fixtures/users.<format>)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=["json", "jsonl"],
+        default="jsonl",
+        help="Output format: one record per line (jsonl) or a single JSON array (json)",
+    )
+    parser.add_argument(
+        "--pretty", action="store_true", help="Indent JSON array output for human reading"
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=os.cpu_count() or 1,
+        help=f"Worker processes for counts of {_PARALLEL_MIN_COUNT:,} or more",
     )
 
     args = parser.parse_args()
 
     print(f"Generating {args.count} users...")
-    users = generate_users(args.count, seed=args.seed, country=args.country)
 
     # Ensure output directory exists
-    output_path = Path(args.output)
+    output_path = Path(args.output or f"fixtures/users.{args.format}")
+    jsonl = args.format == "jsonl"
     output_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Write to file
-    with open(output_path, "w") as f:
-        json.dump(users, f, indent=2)
+    # Stream to file
+    workers = args.workers if args.count >= _PARALLEL_MIN_COUNT else 1
+    if workers > 1:
+        print(f"Using {workers} worker processes")
+    written, _, sample = write_records(
+        output_path,
+        partial(iter_users, country=args.country),
+        args.count,
+        args.seed,
+        jsonl,
+        args.pretty,
+        workers=workers,
+    )
 
-    print(f"Generated {len(users)} users -> {output_path}")
+    print(f"Generated {written} users -> {output_path}")
 
     # Print sample
-    print("\nSample user:")
-    print(json.dumps(users[0], indent=2))
+    if sample is not None:
+        print("\nSample user:")
+        print(json.dumps(sample, indent=2))
 
 
 if __name__ == "__main__":
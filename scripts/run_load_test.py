@@ -9,18 +9,41 @@ Usage:
 
 import argparse
 import os
+import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
+from types import MappingProxyType
 
 import httpx
-from locust.main import main as locust_main
 
 from src.config.defaults import get_service_config
 from src.generators import RuleGenerator
 from src.utilities.harness import LoadTestHarness
+from src.utilities.run_descriptor import write_run_descriptor
 
 LOCUSTFILE = "src/locustfile.py"
 
+# (users, spawn_rate, duration, pacing) for each scenario, derived from the
+# --users / --spawn-rate / --run-time values.
+SCENARIO_PARAMS = MappingProxyType(
+    {
+        "smoke": lambda users, rate, duration: (50, 10, "2m", None),
+        "baseline": lambda users, rate, duration: (users, rate, duration, None),
+        "stress": lambda users, rate, duration: (users * 3, rate * 3, "30m", None),
+        "soak": lambda users, rate, duration: (users, rate // 2, "1h", None),
+        # Fixed arrival rate so a slow SUT cannot throttle the spike.
+        "spike": lambda users, rate, duration: (users * 5, rate * 10, "5m", 0.01),
+        # Minimal load, just seed.
+        "seed-only": lambda users, rate, duration: (1, 1, "1m", None),
+    }
+)
+
+# Headless runs above this many users fork Locust into several processes so
+# the load generator is not pinned to a single core.
+MULTIPROCESS_MIN_USERS = 500
+
 SERVICE_URL_ENV = {
     "rule-engine": ("RULE_ENGINE_AUTH_URL", "http://localhost:8081"),
     "rule-engine-monitoring": ("RULE_ENGINE_MONITORING_URL", "http://localhost:8082"),
@@ -28,6 +51,16 @@ SERVICE_URL_ENV = {
     "trans-mgmt": ("TRANSACTION_MGMT_URL", "http://localhost:8002"),
 }
 
+# FastHttpUser classes in the locustfile that serve each --service selection.
+# Exported as LOCUST_USER_CLASSES so Locust spawns exactly these classes.
+SERVICE_USER_CLASSES = {
+    "all": "RuleEngineUser TransactionManagementUser RuleManagementUser",
+    "rule-engine": "RuleEngineUser",
+    "rule-engine-monitoring": "RuleEngineUser",
+    "rule-mgmt": "RuleManagementUser",
+    "trans-mgmt": "TransactionManagementUser",
+}
+
 SERVICE_HEALTH_PATH = {
     "rule-engine": "/v1/evaluate/health",
     "rule-engine-monitoring": "/v1/evaluate/health",
@@ -86,25 +119,39 @@ def _services_for_selection(selection: str) -> list[str]:
 
 def _preflight_services(selection: str) -> bool:
     """Validate target service endpoints before starting Locust."""
-    services = _services_for_selection(selection)
-
-    print("\nPreflight health checks:")
-    for service in services:
+    targets = []
+    for service in _services_for_selection(selection):
         env_name, default_url = SERVICE_URL_ENV[service]
         base_url = os.getenv(env_name, default_url).rstrip("/")
-        health_path = SERVICE_HEALTH_PATH[service]
-        health_url = f"{base_url}{health_path}"
+        targets.append((service, f"{base_url}{SERVICE_HEALTH_PATH[service]}"))
+
+    def check(client: httpx.Client, url: str) -> str | None:
         try:
-            response = httpx.get(health_url, timeout=10.0)
+            response = client.get(url)
         except Exception as exc:
-            print(f"  [FAIL] {service}: {health_url} ({exc})")
-            return False
+            return str(exc)
         if response.status_code != 200:
-            print(f"  [FAIL] {service}: {health_url} (status {response.status_code})")
-            return False
-        print(f"  [OK] {service}: {health_url}")
+            return f"status {response.status_code}"
+        return None
+
+    # Probe every service at once so preflight waits on the slowest, not the sum.
+    # The transport retries a failed connect once so a container that is still
+    # binding its port doesn't fail the whole run.
+    transport = httpx.HTTPTransport(retries=1)
+    with (
+        httpx.Client(timeout=10.0, transport=transport) as client,
+        ThreadPoolExecutor(len(targets)) as pool,
+    ):
+        errors = list(pool.map(lambda target: check(client, target[1]), targets))
 
-    return True
+    print("\nPreflight health checks:")
+    for (service, health_url), error in zip(targets, errors, strict=True):
+        if error:
+            print(f"  [FAIL] {service}: {health_url} ({error})")
+        else:
+            print(f"  [OK] {service}: {health_url}")
+
+    return not any(errors)
 
 
 def parse_args():
@@ -127,7 +174,7 @@ def parse_args():
         "--scenario",
         type=str,
         default="baseline",
-        choices=["smoke", "baseline", "stress", "soak", "spike", "seed-only"],
+        choices=list(SCENARIO_PARAMS),
         help="Test scenario",
     )
     parser.add_argument(
@@ -146,202 +193,196 @@ def parse_args():
         default=None,
         help="Custom run ID (auto-generated if not provided)",
     )
+    parser.add_argument(
+        "--pacing",
+        type=float,
+        default=None,
+        help=(
+            "Seconds between task starts per user (open-loop constant pacing); "
+            "overrides the scenario default"
+        ),
+    )
+    parser.add_argument(
+        "--target-rps",
+        type=float,
+        default=None,
+        help="Aggregate request rate to pace users towards (sets pacing = users / target-rps)",
+    )
+    parser.add_argument(
+        "--no-csv",
+        action="store_true",
+        help="Skip Locust CSV output; percentiles are still written to percentiles.json",
+    )
+    parser.add_argument(
+        "--no-affinity",
+        action="store_true",
+        help="Don't pin the runner and Locust to separate CPU cores (Linux only)",
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=-1,
+        help=(
+            "Locust processes for headless runs above "
+            f"{MULTIPROCESS_MIN_USERS} users (-1 = one per CPU, 0 = single process)"
+        ),
+    )
 
     return parser.parse_args()
 
 
+# Artifact directories already created by this process.
+_CREATED_ARTIFACT_DIRS: set[Path] = set()
+
+
 def _build_locust_artifact_paths(run_id: str, service_slug: str) -> tuple[str, str]:
     """Create deterministic per-run artifact paths for Locust output."""
     base = Path("html-reports") / "runs" / run_id / "locust"
-    base.mkdir(parents=True, exist_ok=True)
+    if base not in _CREATED_ARTIFACT_DIRS:
+        base.mkdir(parents=True, exist_ok=True)
+        _CREATED_ARTIFACT_DIRS.add(base)
     html_path = base / f"{service_slug}.html"
     csv_prefix = base / service_slug
     return str(html_path), str(csv_prefix)
 
 
-def _run_locust(args: list[str]) -> int:
-    """
-    Execute Locust and normalize its SystemExit behavior.
-
-    Returns process exit code so callers can preserve control flow
-    and still write metadata in finally blocks.
-    """
-    sys.argv = ["locust"] + args
-    try:
-        locust_main()
-        return 0
-    except SystemExit as exc:
-        code = exc.code
-        if code is None:
-            return 0
-        if isinstance(code, int):
-            if code != 0:
-                raise
-            return 0
-        return 0
-
-
-def run_rule_engine(
-    users: int,
-    spawn_rate: int,
-    run_time: str,
-    headless: bool,
-    harness: LoadTestHarness | None = None,
-) -> dict:
-    """Run Rule Engine load test."""
-    print(
-        f"Starting Rule Engine load test: users={users}, "
-        f"spawn={spawn_rate}/s, duration={run_time}"
-    )
-
-    os.environ["TEST_RULE_ENGINE"] = "true"
-    os.environ["TEST_TRANSACTION_MGMT"] = "false"
-    os.environ["TEST_RULE_MGMT"] = "false"
-    os.environ["RULE_ENGINE_MODE"] = "auth"
-    if harness:
-        os.environ["LOADTEST_RUN_ID"] = harness.run_id
-
-    run_id = harness.run_id if harness else "adhoc"
-    html_path, csv_prefix = _build_locust_artifact_paths(run_id, "rule-engine")
-
-    args = [
-        "-f",
-        LOCUSTFILE,
-        "--users",
-        str(users),
-        "--spawn-rate",
-        str(spawn_rate),
-        "--run-time",
-        run_time,
-        "--html",
-        html_path,
-        "--csv",
-        csv_prefix,
-    ]
-
-    if headless:
-        args.append("--headless")
-
-    # Run with harness integration
-    if harness and harness.enable_seed:
-        print("\nRunning with harness seed/teardown...")
-        # Note: Actual seeding happens in main() before this call
-
-    exit_code = _run_locust(args)
-    return {"html": html_path, "csv_prefix": csv_prefix, "exit_code": exit_code}
-
-
-
-def run_rule_engine_monitoring(
-    users: int,
-    spawn_rate: int,
-    run_time: str,
-    headless: bool,
-    harness: LoadTestHarness | None = None,
+def _run_artifacts(
+    run_id: str, html_path: str, csv_prefix: str | None, exit_code: int | None = None
 ) -> dict:
-    """Run Rule Engine load test with MONITORING-only traffic."""
-    print(
-        f"Starting Rule Engine MONITORING load test: users={users}, "
-        f"spawn={spawn_rate}/s, duration={run_time}"
-    )
-
-    os.environ["TEST_RULE_ENGINE"] = "true"
-    os.environ["TEST_TRANSACTION_MGMT"] = "false"
-    os.environ["TEST_RULE_MGMT"] = "false"
-    os.environ["RULE_ENGINE_MODE"] = "monitoring"
-    if harness:
-        os.environ["LOADTEST_RUN_ID"] = harness.run_id
+    """Describe the files a Locust run produced, for the run metadata."""
+    percentiles = Path("html-reports") / "runs" / run_id / "percentiles.json"
+    artifacts = {"html": html_path, "csv_prefix": csv_prefix, "percentiles": str(percentiles)}
+    if exit_code is not None:
+        artifacts["exit_code"] = exit_code
+    return artifacts
+
+
+def _processes_args(processes: int, users: int, headless: bool) -> list[str]:
+    """Return Locust --processes arguments when a run is large enough to fork."""
+    if processes == 0 or not headless or users <= MULTIPROCESS_MIN_USERS:
+        return []
+    if not hasattr(os, "fork"):
+        # Locust cannot fork worker processes on Windows.
+        return []
+    return ["--processes", str(processes)]
+
+
+# Service toggles and rule-engine mode for each selection. The runner writes
+# these to the run descriptor, which src/locustfile.py reads once at startup.
+SERVICE_RUN_SETTINGS = {
+    "all": {
+        "test_rule_engine": True,
+        "test_transaction_mgmt": True,
+        "test_rule_mgmt": True,
+        "test_ops_analyst": False,
+        "rule_engine_mode": "auth",
+    },
+    "rule-engine": {
+        "test_rule_engine": True,
+        "test_transaction_mgmt": False,
+        "test_rule_mgmt": False,
+        "test_ops_analyst": False,
+        "rule_engine_mode": "auth",
+    },
+    "rule-engine-monitoring": {
+        "test_rule_engine": True,
+        "test_transaction_mgmt": False,
+        "test_rule_mgmt": False,
+        "test_ops_analyst": False,
+        "rule_engine_mode": "monitoring",
+    },
+    "rule-mgmt": {
+        "test_rule_engine": False,
+        "test_transaction_mgmt": False,
+        "test_rule_mgmt": True,
+        "test_ops_analyst": False,
+    },
+    "trans-mgmt": {
+        "test_rule_engine": False,
+        "test_transaction_mgmt": True,
+        "test_rule_mgmt": False,
+        "test_ops_analyst": False,
+    },
+}
 
-    run_id = harness.run_id if harness else "adhoc"
-    html_path, csv_prefix = _build_locust_artifact_paths(run_id, "rule-engine-monitoring")
 
-    args = [
-        "-f",
-        LOCUSTFILE,
-        "--users",
-        str(users),
-        "--spawn-rate",
-        str(spawn_rate),
-        "--run-time",
-        run_time,
-        "--html",
-        html_path,
-        "--csv",
-        csv_prefix,
-    ]
+# Banner label and artifact file slug for each selection.
+SERVICE_RUN_LABELS = {
+    "all": ("All Services", "all-services"),
+    "rule-engine": ("Rule Engine", "rule-engine"),
+    "rule-engine-monitoring": ("Rule Engine MONITORING", "rule-engine-monitoring"),
+    "rule-mgmt": ("Rule Mgmt", "rule-mgmt"),
+    "trans-mgmt": ("Transaction Mgmt", "trans-mgmt"),
+}
 
-    if headless:
-        args.append("--headless")
 
-    exit_code = _run_locust(args)
-    return {"html": html_path, "csv_prefix": csv_prefix, "exit_code": exit_code}
+def _prepare_locust_run(service: str, run_id: str, pacing: float | None = None) -> None:
+    """Write the run descriptor and export the variables Locust itself needs."""
+    settings = SERVICE_RUN_SETTINGS[service]
+    write_run_descriptor(run_id, {**settings, "pacing": pacing})
 
+    env = {"LOADTEST_RUN_ID": run_id, "LOCUST_USER_CLASSES": SERVICE_USER_CLASSES[service]}
+    if "rule_engine_mode" in settings:
+        # config/defaults.py resolves the rule-engine traffic mix from this.
+        env["RULE_ENGINE_MODE"] = settings["rule_engine_mode"]
+    os.environ.update(env)
 
-def run_rule_management(
-    users: int,
-    spawn_rate: int,
-    run_time: str,
-    headless: bool,
-    harness: LoadTestHarness | None = None,
-) -> dict:
-    """Run Rule Management load test."""
-    print(
-        f"Starting Rule Mgmt load test: users={users}, "
-        f"spawn={spawn_rate}/s, duration={run_time}"
-    )
 
-    os.environ["TEST_RULE_ENGINE"] = "false"
-    os.environ["TEST_TRANSACTION_MGMT"] = "false"
-    os.environ["TEST_RULE_MGMT"] = "true"
-    if harness:
-        os.environ["LOADTEST_RUN_ID"] = harness.run_id
+def _pin_runner_cpu(enabled: bool) -> set[int] | None:
+    """
+    Pin the runner to its first allowed core and return the cores left for Locust.
 
-    run_id = harness.run_id if harness else "adhoc"
-    html_path, csv_prefix = _build_locust_artifact_paths(run_id, "rule-mgmt")
+    Returns None (and pins nothing) when disabled, when the platform has no
+    sched_setaffinity (non-Linux), or when only one core is available.
+    """
+    if not enabled or not hasattr(os, "sched_setaffinity"):
+        return None
+    cpus = sorted(os.sched_getaffinity(0))
+    if len(cpus) < 2:
+        return None
+    os.sched_setaffinity(0, {cpus[0]})
+    return set(cpus[1:])
 
-    args = [
-        "-f",
-        LOCUSTFILE,
-        "--users",
-        str(users),
-        "--spawn-rate",
-        str(spawn_rate),
-        "--run-time",
-        run_time,
-        "--html",
-        html_path,
-        "--csv",
-        csv_prefix,
-    ]
 
-    if headless:
-        args.append("--headless")
+def _run_locust(args: list[str], cpus: set[int] | None = None) -> int:
+    """
+    Execute Locust in a child process.
 
-    exit_code = _run_locust(args)
-    return {"html": html_path, "csv_prefix": csv_prefix, "exit_code": exit_code}
+    Locust inherits the runner's environment (LOADTEST_RUN_ID and
+    LOCUST_USER_CLASSES). When cpus is given, Locust and the workers it forks
+    are restricted to those cores. Returns the process exit code so callers
+    can preserve control flow and still write metadata in finally blocks.
+    """
+    with subprocess.Popen([sys.executable, "-m", "locust", *args]) as proc:
+        # Pinned from the parent: preexec_fn is unsafe once the runner has threads.
+        # Locust forks its workers after importing, so they inherit the mask.
+        if cpus:
+            os.sched_setaffinity(proc.pid, cpus)
+        return proc.wait()
 
 
-def run_transaction_management(
+def run_service(
+    service: str,
     users: int,
     spawn_rate: int,
     run_time: str,
     headless: bool,
     harness: LoadTestHarness | None = None,
+    processes: int = -1,
+    pacing: float | None = None,
+    csv: bool = True,
+    cpus: set[int] | None = None,
 ) -> dict:
-    """Run Transaction Management load test."""
+    """Run a load test against one --service selection ("all" runs every service at once)."""
+    label, artifact_slug = SERVICE_RUN_LABELS[service]
     print(
-        f"Starting Transaction Mgmt: users={users}, "
+        f"Starting {label} load test: users={users}, "
         f"spawn={spawn_rate}/s, duration={run_time}"
     )
 
-    os.environ["TEST_RULE_ENGINE"] = "false"
-    os.environ["TEST_TRANSACTION_MGMT"] = "true"
-    os.environ["TEST_RULE_MGMT"] = "false"
-    if harness:
-        os.environ["LOADTEST_RUN_ID"] = harness.run_id
-
     run_id = harness.run_id if harness else "adhoc"
-    html_path, csv_prefix = _build_locust_artifact_paths(run_id, "trans-mgmt")
+    _prepare_locust_run(service, run_id, pacing)
+    html_path, csv_prefix = _build_locust_artifact_paths(run_id, artifact_slug)
 
     args = [
         "-f",
@@ -354,32 +395,32 @@ def run_transaction_management(
         run_time,
         "--html",
         html_path,
-        "--csv",
-        csv_prefix,
     ]
 
+    if csv:
+        args.extend(["--csv", csv_prefix])
     if headless:
         args.append("--headless")
+    if cpus and processes == -1:
+        # Locust's auto count uses every core; match the cores it is pinned to.
+        processes = len(cpus)
+    args.extend(_processes_args(processes, users, headless))
 
-    exit_code = _run_locust(args)
-    return {"html": html_path, "csv_prefix": csv_prefix, "exit_code": exit_code}
+    exit_code = _run_locust(args, cpus)
+    return _run_artifacts(run_id, html_path, csv_prefix if csv else None, exit_code)
 
 
 def get_scenario_params(
     scenario: str, base_users: int, base_spawn_rate: int, base_run_time: str
-) -> tuple[int, int, str]:
-    """Get parameters adjusted for scenario."""
-    scenario_config = {
-        "smoke": {"users": 50, "spawn_rate": 10, "duration": "2m"},
-        "baseline": {"users": base_users, "spawn_rate": base_spawn_rate, "duration": base_run_time},
-        "stress": {"users": base_users * 3, "spawn_rate": base_spawn_rate * 3, "duration": "30m"},
-        "soak": {"users": base_users, "spawn_rate": base_spawn_rate // 2, "duration": "1h"},
-        "spike": {"users": base_users * 5, "spawn_rate": base_spawn_rate * 10, "duration": "5m"},
-        "seed-only": {"users": 1, "spawn_rate": 1, "duration": "1m"},  # Minimal load, just seed
-    }
+) -> tuple[int, int, str, float | None]:
+    """
+    Get parameters adjusted for scenario.
 
-    config = scenario_config.get(scenario, scenario_config["baseline"])
-    return config["users"], config["spawn_rate"], config["duration"]
+    The last element is the per-user pacing in seconds, or None to let users
+    run closed-loop (next task as soon as the previous response arrives).
+    """
+    params = SCENARIO_PARAMS.get(scenario, SCENARIO_PARAMS["baseline"])
+    return params(base_users, base_spawn_rate, base_run_time)
 
 
 def main():
@@ -387,9 +428,13 @@ def main():
     args = parse_args()
 
     # Get scenario-adjusted parameters
-    users, spawn_rate, run_time = get_scenario_params(
+    users, spawn_rate, run_time, pacing = get_scenario_params(
         args.scenario, args.users, args.spawn_rate, args.run_time
     )
+    if args.pacing is not None:
+        pacing = args.pacing
+    elif args.target_rps:
+        pacing = users / args.target_rps
 
     # Initialize harness for seed/test/teardown workflow
     harness = LoadTestHarness(
@@ -398,7 +443,6 @@ def main():
         enable_teardown=not args.skip_teardown,
     )
     if harness.start_time is None:
-        from datetime import datetime
         harness.start_time = datetime.now()
 
     print(f"\n{'=' * 70}")
@@ -406,6 +450,7 @@ def main():
     print(f"Service: {args.service}")
     print(f"Scenario: {args.scenario}")
     print(f"Users: {users}, Spawn Rate: {spawn_rate}/s, Duration: {run_time}")
+    print(f"Pacing: {pacing:g}s per user" if pacing else "Pacing: closed-loop")
     print(f"Seed: {harness.enable_seed}, Teardown: {harness.enable_teardown}")
     print(f"{'=' * 70}\n")
 
@@ -416,6 +461,11 @@ def main():
         print("Start shared containers first: doppler run -- uv run platform-up -- --apps")
         sys.exit(1)
 
+    # Keep the orchestrator off the cores that generate load.
+    locust_cpus = _pin_runner_cpu(not args.no_affinity)
+    if locust_cpus:
+        print(f"Runner pinned to one core; Locust gets {len(locust_cpus)} cores")
+
     try:
         # SEED PHASE
         if harness.enable_seed:
@@ -475,53 +525,26 @@ def main():
         # TEST PHASE
         if args.scenario == "seed-only":
             print("\nSeed-only scenario complete. No load test executed.")
-        elif args.service == "all":
-            # Run all user classes in a single Locust run (no -T filter).
-            # locustfile.py controls which services are active via TEST_* env vars.
-            os.environ["TEST_RULE_ENGINE"] = "true"
-            os.environ["RULE_ENGINE_MODE"] = "auth"
-            os.environ["TEST_TRANSACTION_MGMT"] = "true"
-            os.environ["TEST_RULE_MGMT"] = "true"
-            os.environ["LOADTEST_RUN_ID"] = harness.run_id
-            html_path, csv_prefix = _build_locust_artifact_paths(harness.run_id, "all-services")
-            run_artifacts = {"html": html_path, "csv_prefix": csv_prefix}
-
-            args_list = [
-                "--users",
-                str(users),
-                "--spawn-rate",
-                str(spawn_rate),
-                "--run-time",
+        else:
+            # "all" runs every user class in a single Locust run; the run
+            # descriptor tells locustfile.py which services are active.
+            run_artifacts = run_service(
+                args.service,
+                users,
+                spawn_rate,
                 run_time,
-                "-f",
-                LOCUSTFILE,
-                "--html",
-                html_path,
-                "--csv",
-                csv_prefix,
-            ]
-            if args.headless:
-                args_list.append("--headless")
-
-            run_artifacts["exit_code"] = _run_locust(args_list)
-        elif args.service == "rule-engine":
-            run_artifacts = run_rule_engine(users, spawn_rate, run_time, args.headless, harness)
-        elif args.service == "rule-engine-monitoring":
-            run_artifacts = run_rule_engine_monitoring(
-                users, spawn_rate, run_time, args.headless, harness
-            )
-        elif args.service == "rule-mgmt":
-            run_artifacts = run_rule_management(users, spawn_rate, run_time, args.headless, harness)
-        elif args.service == "trans-mgmt":
-            run_artifacts = run_transaction_management(
-                users, spawn_rate, run_time, args.headless, harness
+                args.headless,
+                harness,
+                processes=args.processes,
+                pacing=pacing,
+                csv=not args.no_csv,
+                cpus=locust_cpus,
             )
 
     except KeyboardInterrupt:
         print("\n\nInterrupted by user.")
     finally:
         if harness.end_time is None:
-            from datetime import datetime
             harness.end_time = datetime.now()
         # TEARDOWN PHASE
         if harness.enable_teardown:
@@ -541,6 +564,7 @@ def main():
             ),
         }
         container_limits = {k: v for k, v in container_limits.items() if v}
+        rule_engine_mix = get_service_config("rule-engine").traffic_mix
 
         metadata = {
             "service": args.service,
@@ -548,6 +572,7 @@ def main():
             "users": users,
             "spawn_rate": spawn_rate,
             "run_time": run_time,
+            "pacing": pacing,
             "auth_strategy": "api-gateway",
             "service_urls": urls,
             "container_limits": container_limits,
@@ -558,18 +583,19 @@ def main():
                 "protocol": os.getenv("REDIS_PROTOCOL"),
             },
             "traffic_mix": {
-                "rule_engine_auth_weight": (
-                    get_service_config("rule-engine").traffic_mix.preauth
-                ),
-                "rule_engine_monitoring_weight": (
-                    get_service_config("rule-engine").traffic_mix.postauth
-                ),
+                "rule_engine_auth_weight": rule_engine_mix.preauth,
+                "rule_engine_monitoring_weight": rule_engine_mix.postauth,
             },
             "artifacts": run_artifacts,
         }
 
         harness.write_run_metadata(metadata=metadata)
 
+    # Propagate a failed Locust run (e.g. threshold breach) to the caller.
+    exit_code = run_artifacts.get("exit_code")
+    if exit_code:
+        sys.exit(exit_code)
+
 
 def web_ui():
     """Start Locust web UI for interactive testing."""
@@ -579,12 +605,7 @@ def web_ui():
     print("  doppler run -- uv run lt-web\n")
 
     # Start Locust in web mode
-    sys.argv = [
-        "locust",
-        "-f",
-        "src/locustfile.py",
-    ]
-    locust_main()
+    sys.exit(_run_locust(["-f", LOCUSTFILE]))
 
 
 def _inject_service_arg(service: str):
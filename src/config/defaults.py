@@ -6,10 +6,11 @@ Loads settings from environment with sensible defaults.
 from __future__ import annotations
 
 import os
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from functools import lru_cache
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TrafficMix:
     """Traffic mix configuration."""
 
@@ -17,7 +18,7 @@ class TrafficMix:
     postauth: float = 0.0  # 0% MONITORING for AUTH-only load test
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleEngineConfig:
     """Configuration for Rule Engine load testing."""
 
@@ -45,11 +46,7 @@ class RuleEngineConfig:
     duration_soak: str = "1h"
 
     # Traffic mix
-    traffic_mix: TrafficMix | None = None
-
-    def __post_init__(self):
-        if self.traffic_mix is None:
-            self.traffic_mix = TrafficMix()
+    traffic_mix: TrafficMix = field(default_factory=TrafficMix)
 
     @classmethod
     def from_env(cls) -> RuleEngineConfig:
@@ -101,7 +98,7 @@ class RuleEngineConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionMgmtTrafficMix:
     """Traffic mix for Transaction Management."""
 
@@ -110,7 +107,7 @@ class TransactionMgmtTrafficMix:
     detail_query: float = 0.20
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class TransactionManagementConfig:
     """Configuration for Transaction Management load testing."""
 
@@ -122,11 +119,7 @@ class TransactionManagementConfig:
     users_normal: int = 200
     users_heavy: int = 500
 
-    traffic_mix: TransactionMgmtTrafficMix | None = None
-
-    def __post_init__(self):
-        if self.traffic_mix is None:
-            self.traffic_mix = TransactionMgmtTrafficMix()
+    traffic_mix: TransactionMgmtTrafficMix = field(default_factory=TransactionMgmtTrafficMix)
 
     @classmethod
     def from_env(cls) -> TransactionManagementConfig:
@@ -135,7 +128,7 @@ class TransactionManagementConfig:
         )
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleMgmtTrafficMix:
     """Traffic mix for Rule Management."""
 
@@ -145,7 +138,7 @@ class RuleMgmtTrafficMix:
     update_rule: float = 0.10
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RuleManagementConfig:
     """Configuration for Rule Management load testing."""
 
@@ -158,18 +151,14 @@ class RuleManagementConfig:
     users_normal: int = 50
     users_heavy: int = 100
 
-    traffic_mix: RuleMgmtTrafficMix | None = None
-
-    def __post_init__(self):
-        if self.traffic_mix is None:
-            self.traffic_mix = RuleMgmtTrafficMix()
+    traffic_mix: RuleMgmtTrafficMix = field(default_factory=RuleMgmtTrafficMix)
 
     @classmethod
     def from_env(cls) -> RuleManagementConfig:
         return cls()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpsAnalystTrafficMix:
     """Traffic mix for Ops Analyst Agent."""
 
@@ -178,7 +167,7 @@ class OpsAnalystTrafficMix:
     insights: float = 0.20
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class OpsAnalystConfig:
     """Configuration for Ops Analyst Agent load testing.
 
@@ -194,11 +183,7 @@ class OpsAnalystConfig:
     users_normal: int = 25
     users_heavy: int = 50
 
-    traffic_mix: OpsAnalystTrafficMix | None = None
-
-    def __post_init__(self):
-        if self.traffic_mix is None:
-            self.traffic_mix = OpsAnalystTrafficMix()
+    traffic_mix: OpsAnalystTrafficMix = field(default_factory=OpsAnalystTrafficMix)
 
     @classmethod
     def from_env(cls) -> OpsAnalystConfig:
@@ -208,41 +193,30 @@ class OpsAnalystConfig:
 
 
 # Service registry
-SERVICE_CONFIGS = {
-    "rule-engine": None,  # Loaded lazily
-    "rule-management": None,
-    "transaction-management": None,
-    "ops-analyst-agent": None,
+SERVICE_CONFIG_CLASSES = {
+    "rule-engine": RuleEngineConfig,
+    "rule-management": RuleManagementConfig,
+    "transaction-management": TransactionManagementConfig,
+    "ops-analyst-agent": OpsAnalystConfig,
 }
 
 
 def load_config() -> dict:
     """Load all configurations from environment."""
-    return {
-        "rule-engine": get_service_config("rule-engine"),
-        "rule-management": get_service_config("rule-management"),
-        "transaction-management": get_service_config("transaction-management"),
-        "ops-analyst-agent": get_service_config("ops-analyst-agent"),
-    }
+    return {name: get_service_config(name) for name in SERVICE_CONFIG_CLASSES}
 
 
+@lru_cache(maxsize=8)
 def get_service_config(service_name: str):
-    """Get config for a specific service."""
-    config_map = {
-        "rule-engine": RuleEngineConfig,
-        "rule-management": RuleManagementConfig,
-        "transaction-management": TransactionManagementConfig,
-        "ops-analyst-agent": OpsAnalystConfig,
-    }
-
-    if service_name not in config_map:
-        raise ValueError(f"Unknown service: {service_name}")
-
-    # Return cached config or create new one
-    if SERVICE_CONFIGS[service_name] is None:
-        SERVICE_CONFIGS[service_name] = config_map[service_name].from_env()
+    """
+    Get config for a specific service.
 
-    return SERVICE_CONFIGS[service_name]
+    Built from the environment on first use and cached for the process, so
+    env vars set before the first call (e.g. RULE_ENGINE_MODE) still apply.
+    """
+    if service_name not in SERVICE_CONFIG_CLASSES:
+        raise ValueError(f"Unknown service: {service_name}")
+    return SERVICE_CONFIG_CLASSES[service_name].from_env()
 
 
 # Scenario configurations
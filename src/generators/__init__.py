@@ -2,66 +2,233 @@
 Test data generators for load testing.
 """
 
+from __future__ import annotations
+
+import os
 import random
 import uuid
-from dataclasses import dataclass
-from datetime import UTC, datetime
+from bisect import bisect
+from dataclasses import dataclass, field
+from datetime import UTC, datetime, timedelta
+from functools import cache
+from itertools import accumulate
 
+import numpy as np
 from faker import Faker
 
+try:
+    # Package-style imports (used by console script entry points).
+    from src.utilities.jsonio import dumps
+except ModuleNotFoundError:
+    # Backward-compatible imports when running with src on PYTHONPATH.
+    from utilities.jsonio import dumps
+
 fake = Faker()
 
+# Transactions pre-sampled per vectorized refill.
+_BATCH_SIZE = 10_000
+# Distinct Faker values kept per string pool.
+_POOL_SIZE = 10_000
+
+_CARD_PREFIXES = ("4111", "5411", "3700", "6011")
+_DEVICE_TYPES = ("mobile", "desktop", "tablet")
+_DEVICE_OS = ("iOS", "Android", "Windows", "macOS")
+_DEVICE_BROWSERS = ("Chrome", "Safari", "Firefox", "Edge")
+_USER_COUNTRIES = ("IN", "US", "SG")
+_PREAUTH_DECISIONS = ("DECLINE", "REVIEW")
+_SEVERITIES = ("LOW", "MEDIUM", "HIGH")
+
+# (network, leading digit) pairs for generated card numbers.
+_CARD_NETWORK_PREFIXES = (("VISA", "4"), ("MASTERCARD", "5"), ("AMEX", "3"), ("RUPAY", "6"))
+
+# Map ruleset type to standard ruleset keys
+_RULESET_KEY_MAP = {
+    "PREAUTH": "CARD_AUTH",
+    "POSTAUTH": "CARD_MONITORING",
+}
 
-@dataclass
-class TransactionTemplate:
-    """Template for generating test transactions."""
+# Determine region from country (simplified mapping)
+_REGION_MAP = {
+    "US": "AMERICAS",
+    "CA": "AMERICAS",
+    "MX": "AMERICAS",
+    "BR": "AMERICAS",
+    "IN": "APAC",
+    "SG": "APAC",
+    "AU": "APAC",
+    "GB": "EMEA",
+    "DE": "EMEA",
+    "FR": "EMEA",
+}
 
-    country: str
-    card_networks: list[str]
-    merchant_categories: list[str]
-    currency: str
-    amount_ranges: list[tuple]
+# Seeded from os.urandom once per process, so IDs differ across Locust workers
+# without paying for a urandom syscall per ID.
+_id_rng = random.Random()
+os.register_at_fork(after_in_child=_id_rng.seed)
+
+
+def _fast_hex(n: int) -> str:
+    """Return n random hex digits for load-test IDs (not cryptographically secure)."""
+    return f"{_id_rng.getrandbits(n * 4):0{n}x}"
+
+
+@cache
+def _faker_pool(provider: str) -> tuple[str, ...]:
+    """Sample a fixed pool of values from a Faker provider on first use."""
+    method = getattr(fake, provider)
+    return tuple(method() for _ in range(_POOL_SIZE))
+
+
+# One row per transaction; string fields hold indices into small lookup tuples.
+_TRANSACTION_DTYPE = np.dtype(
+    [
+        ("offset", "u2"),  # minutes before the batch reference time
+        ("card_prefix", "u1"),
+        ("card_suffix", "u2"),
+        ("last4", "u2"),
+        ("network", "u1"),
+        ("merchant", "u4"),
+        ("mcc", "u1"),
+        ("ip", "u2"),
+        ("amount", "f8"),
+        ("city", "u2"),
+        ("state", "u2"),
+        ("device_type", "u1"),
+        ("device_os", "u1"),
+        ("browser", "u1"),
+    ]
+)
+
+
+class TransactionBatch:
+    """
+    Transactions sampled column-wise into a NumPy structured array.
+
+    Rows stay as packed numbers until a caller asks for one, so only the
+    transactions that are actually sent get materialized as dicts.
+    """
+
+    def __init__(self, template: TransactionTemplate, rows: np.ndarray, now: datetime):
+        self.template = template
+        self.rows = rows
+        self.now = now
+        self._ips = _faker_pool("ipv4")
+        self._cities = _faker_pool("city")
+        self._states = _faker_pool("state_abbr")
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self):
+        for i in range(len(self.rows)):
+            yield self.to_dict(i)
+
+    def to_dict(self, i: int) -> dict:
+        """Materialize row i in the transaction request shape."""
+        (
+            offset,
+            card_prefix,
+            card_suffix,
+            last4,
+            network,
+            merchant,
+            mcc,
+            ip,
+            amount,
+            city,
+            state,
+            device_type,
+            device_os,
+            browser,
+        ) = self.rows[i].tolist()
+        template = self.template
+        country = template.country
 
-    def generate(self) -> dict:
-        """Generate a single transaction."""
         return {
-            "transaction_id": f"txn_{uuid.uuid4().hex[:16]}",
-            "occurred_at": (
-                datetime.now(UTC) - datetime.timedelta(minutes=random.randint(0, 10080))
-            ).isoformat()
-            + "Z",
-            "card_id": self._generate_card_id(),
-            "card_last4": fake.credit_card_number()[-4:],
-            "card_network": random.choice(self.card_networks),
-            "merchant_id": f"M{random.randint(10000, 99999)}",
-            "mcc": random.choice(self.merchant_categories),
-            "ip": fake.ipv4(),
-            "amount": self._generate_amount(),
-            "currency": self.currency,
+            "transaction_id": f"txn_{_fast_hex(16)}",
+            "occurred_at": (self.now - timedelta(minutes=offset)).isoformat() + "Z",
+            "card_id": f"{_CARD_PREFIXES[card_prefix]}********{card_suffix}",
+            "card_last4": f"{last4:04d}",
+            "card_network": template.card_networks[network],
+            "merchant_id": f"M{merchant}",
+            "mcc": template.merchant_categories[mcc],
+            "ip": self._ips[ip],
+            "amount": amount,
+            "currency": template.currency,
             # Use country_code to match rule-engine request schema.
-            "country_code": self.country,
+            "country_code": country,
             "billing_address": {
-                "city": fake.city(),
-                "state": fake.state_abbr(),
-                "country": self.country,
+                "city": self._cities[city],
+                "state": self._states[state],
+                "country": country,
             },
             "device": {
-                "type": random.choice(["mobile", "desktop", "tablet"]),
-                "os": random.choice(["iOS", "Android", "Windows", "macOS"]),
-                "browser": random.choice(["Chrome", "Safari", "Firefox", "Edge"]),
+                "type": _DEVICE_TYPES[device_type],
+                "os": _DEVICE_OS[device_os],
+                "browser": _DEVICE_BROWSERS[browser],
             },
         }
 
-    def _generate_card_id(self) -> str:
-        """Generate tokenized card ID."""
-        prefix = random.choice(["4111", "5411", "3700", "6011"])
-        masked = f"{prefix}{'*' * 8}{random.randint(1000, 9999)}"
-        return masked
+    def to_json_bytes(self, i: int) -> bytes:
+        """Materialize row i as a JSON request body."""
+        return dumps(self.to_dict(i))
 
-    def _generate_amount(self) -> float:
-        """Generate amount in cents."""
-        range_ = random.choice(self.amount_ranges)
-        return round(random.uniform(range_[0], range_[1]), 2)
+
+@dataclass(slots=True)
+class TransactionTemplate:
+    """Template for generating test transactions."""
+
+    country: str
+    card_networks: list[str]
+    merchant_categories: list[str]
+    currency: str
+    amount_ranges: list[tuple]
+
+    # Pre-sampled transactions consumed by generate().
+    _batch: TransactionBatch | None = field(default=None, init=False, repr=False)
+    _cursor: int = field(default=0, init=False, repr=False)
+
+    def generate(self) -> dict:
+        """Generate a single transaction from the pre-sampled batch."""
+        i = self._cursor
+        batch = self._batch
+        if batch is None or i >= len(batch):
+            batch = self._batch = self.sample(_BATCH_SIZE)
+            i = 0
+        self._cursor = i + 1
+        return batch.to_dict(i)
+
+    def reset(self) -> None:
+        """Drop pre-sampled rows so the next batch is drawn from the current seed."""
+        self._batch = None
+        self._cursor = 0
+
+    def sample(self, n: int) -> TransactionBatch:
+        """Sample the fields of n transactions with vectorized NumPy draws."""
+        # Seed from the random module so TransactionGenerator(seed=...) stays reproducible.
+        rng = np.random.default_rng(random.getrandbits(64))
+        rows = np.empty(n, dtype=_TRANSACTION_DTYPE)
+
+        # Pick an amount range per row (in cents), then a uniform amount inside it.
+        ranges = np.asarray(self.amount_ranges, dtype=np.float64)
+        picked = ranges[rng.integers(0, len(ranges), n)]
+        rows["amount"] = np.round(rng.uniform(picked[:, 0], picked[:, 1]), 2)
+
+        rows["offset"] = rng.integers(0, 10081, n)
+        rows["card_prefix"] = rng.integers(0, len(_CARD_PREFIXES), n)
+        rows["card_suffix"] = rng.integers(1000, 10000, n)
+        rows["last4"] = rng.integers(0, 10000, n)
+        rows["network"] = rng.integers(0, len(self.card_networks), n)
+        rows["merchant"] = rng.integers(10000, 100000, n)
+        rows["mcc"] = rng.integers(0, len(self.merchant_categories), n)
+        rows["ip"] = rng.integers(0, _POOL_SIZE, n)
+        rows["city"] = rng.integers(0, _POOL_SIZE, n)
+        rows["state"] = rng.integers(0, _POOL_SIZE, n)
+        rows["device_type"] = rng.integers(0, len(_DEVICE_TYPES), n)
+        rows["device_os"] = rng.integers(0, len(_DEVICE_OS), n)
+        rows["browser"] = rng.integers(0, len(_DEVICE_BROWSERS), n)
+
+        return TransactionBatch(self, rows, datetime.now(UTC))
 
 
 # Country-specific templates
@@ -81,6 +248,7 @@ TEMPLATES = {
         amount_ranges=[(100, 5000), (5001, 50000), (50001, 200000), (200001, 1000000)],
     ),
 }
+_TEMPLATE_COUNTRIES = tuple(TEMPLATES)
 
 
 class TransactionGenerator:
@@ -89,11 +257,13 @@ class TransactionGenerator:
     def __init__(self, seed: int = 42):
         random.seed(seed)
         fake.seed_instance(seed)
+        for template in TEMPLATES.values():
+            template.reset()
 
     def generate(self, country: str | None = None, risk_level: str = "normal") -> dict:
         """Generate a single transaction."""
         if country is None:
-            country = random.choice(list(TEMPLATES.keys()))
+            country = random.choice(_TEMPLATE_COUNTRIES)
 
         template = TEMPLATES.get(country, TEMPLATES["IN"])
         tx = template.generate()
@@ -107,6 +277,26 @@ class TransactionGenerator:
 
         return tx
 
+    def generate_soa(self, n: int, country: str | None = None) -> TransactionBatch:
+        """
+        Sample n normal-risk transactions column-wise without building dicts.
+
+        Use batch.to_dict(i) or batch.to_json_bytes(i) to materialize a row
+        when a task actually sends it.
+        """
+        if country is None:
+            country = random.choice(_TEMPLATE_COUNTRIES)
+        return TEMPLATES.get(country, TEMPLATES["IN"]).sample(n)
+
+    def generate_bytes(self, country: str | None = None, risk_level: str = "normal") -> bytes:
+        """
+        Generate a single transaction already encoded as JSON bytes.
+
+        Pass the result as the request body (data= for FastHttpUser, content=
+        for httpx) to skip the client's own JSON encoder.
+        """
+        return dumps(self.generate(country, risk_level))
+
     def generate_batch(
         self, count: int, country: str | None = None, distribution: dict | None = None
     ) -> list[dict]:
@@ -114,9 +304,14 @@ class TransactionGenerator:
         if distribution is None:
             distribution = {"normal": 0.8, "high": 0.15, "suspicious": 0.05}
 
+        # Build the cumulative thresholds once; each draw is then one bisect.
+        labels = tuple(distribution)
+        thresholds = list(accumulate(distribution.values()))
+        total = thresholds[-1]
+
         transactions = []
         for _ in range(count):
-            risk = random.choices(list(distribution.keys()), weights=list(distribution.values()))[0]
+            risk = labels[bisect(thresholds, random.random() * total)]
 
             transactions.append(self.generate(country, risk))
 
@@ -141,7 +336,7 @@ class UserGenerator:
     def generate(self, country: str | None = None) -> dict:
         """Generate a single user."""
         if country is None:
-            country = random.choice(["IN", "US", "SG"])
+            country = random.choice(_USER_COUNTRIES)
 
         Faker.seed(random.randint(0, 1000000))
 
@@ -163,9 +358,7 @@ class UserGenerator:
 
     def _generate_card_number(self) -> str:
         """Generate a valid-looking card number."""
-        prefixes = {"VISA": "4", "MASTERCARD": "5", "AMEX": "3", "RUPAY": "6"}
-        network = random.choice(list(prefixes.keys()))
-        prefix = prefixes[network]
+        _network, prefix = random.choice(_CARD_NETWORK_PREFIXES)
         return f"{prefix}{random.randint(100000000000000, 999999999999999)}"
 
     def generate_batch(self, count: int) -> list[dict]:
@@ -198,12 +391,12 @@ class RuleGenerator:
 
         if rule_type == "PREAUTH":
             rule["action"] = {
-                "decision": random.choice(["DECLINE", "REVIEW"]),
+                "decision": random.choice(_PREAUTH_DECISIONS),
                 "reason_code": f"RULE_{random.randint(100, 999)}",
             }
         else:
             rule["action"] = {
-                "severity": random.choice(["LOW", "MEDIUM", "HIGH"]),
+                "severity": random.choice(_SEVERITIES),
                 "tags": [f"tag_{i}" for i in range(random.randint(1, 3))],
             }
 
@@ -234,30 +427,11 @@ class RuleGenerator:
         """
         rules = self.generate_batch(rule_count, ruleset_type)
 
-        # Map ruleset type to standard ruleset keys
-        ruleset_key_map = {
-            "PREAUTH": "CARD_AUTH",
-            "POSTAUTH": "CARD_MONITORING",
-        }
-        ruleset_key = ruleset_key_map.get(ruleset_type, "CARD_AUTH")
-
-        # Determine region from country (simplified mapping)
-        region_map = {
-            "US": "AMERICAS",
-            "CA": "AMERICAS",
-            "MX": "AMERICAS",
-            "BR": "AMERICAS",
-            "IN": "APAC",
-            "SG": "APAC",
-            "AU": "APAC",
-            "GB": "EMEA",
-            "DE": "EMEA",
-            "FR": "EMEA",
-        }
-        region = region_map.get(country, "GLOBAL")
+        ruleset_key = _RULESET_KEY_MAP.get(ruleset_type, "CARD_AUTH")
+        region = _REGION_MAP.get(country, "GLOBAL")
 
         return {
-            "ruleset_id": f"rs_{uuid.uuid4().hex[:12]}",
+            "ruleset_id": f"rs_{_fast_hex(12)}",
             "ruleset_key": ruleset_key,
             "country": country,
             "region": region,
@@ -9,13 +9,19 @@ Usage:
     uv run lt-web
 """
 
+from __future__ import annotations
+
+import importlib
+import logging
 import os
+import random
 import sys
+from dataclasses import dataclass
 from pathlib import Path
 
-from locust import between, events
+from locust import between, constant_pacing, events
 from locust.contrib.fasthttp import FastHttpUser
-from locust.runners import MasterRunner
+from locust.runners import MasterRunner, WorkerRunner
 
 # Add src to path for imports
 PROJECT_ROOT = Path(__file__).parent.parent
@@ -24,17 +30,83 @@ sys.path.insert(0, str(PROJECT_ROOT / "src"))
 from config.defaults import get_service_config  # noqa: E402
 from utilities.metrics import metrics_collector  # noqa: E402
 from utilities.reporting import report_generator  # noqa: E402
+from utilities.run_descriptor import load_run_descriptor  # noqa: E402
+
+logger = logging.getLogger(__name__)
+
 
 # =============================================================================
 # Environment Configuration
 # =============================================================================
 
+# FastHttpUser keeps connections alive and pools 10 per user by default; fail
+# fast on connect, and cap reads well above each service's p99 target instead
+# of Locust's 60s default so a stalled service surfaces as failures.
+CONNECTION_TIMEOUT_S = 2.0
+
+# Installed as each user's default_headers: the HTTP client merges them into
+# its defaults once per user, so tasks pass no headers and no per-request
+# header dict has to be merged in.
+JSON_HEADERS = {
+    "Content-Type": "application/json",
+    "Accept": "application/json",
+    "Accept-Encoding": "gzip, deflate",
+}
+
 RULE_ENGINE_AUTH_URL = os.getenv("RULE_ENGINE_AUTH_URL", "http://localhost:8081")
 RULE_ENGINE_MONITORING_URL = os.getenv("RULE_ENGINE_MONITORING_URL", "http://localhost:8082")
 RULE_MGMT_URL = os.getenv("RULE_MGMT_URL", "http://localhost:8000")
 TRANSACTION_MGMT_URL = os.getenv("TRANSACTION_MGMT_URL", "http://localhost:8002")
 OPS_ANALYST_URL = os.getenv("OPS_ANALYST_URL", "http://localhost:8003")
 
+
+
+@dataclass(frozen=True, slots=True)
+class RunSettings:
+    """Service selection for this run, resolved once at startup."""
+
+    test_rule_engine: bool
+    test_transaction_mgmt: bool
+    test_rule_mgmt: bool
+    test_ops_analyst: bool
+    rule_engine_mode: str
+    pacing: float | None  # Seconds between task starts per user; None = closed-loop
+
+    @classmethod
+    def load(cls) -> RunSettings:
+        """Read the runner's run descriptor, falling back to TEST_* env vars."""
+        descriptor = load_run_descriptor() or {}
+
+        def flag(key: str, env_name: str, default: str) -> bool:
+            if key in descriptor:
+                return bool(descriptor[key])
+            return os.getenv(env_name, default).lower() == "true"
+
+        return cls(
+            test_rule_engine=flag("test_rule_engine", "TEST_RULE_ENGINE", "true"),
+            test_transaction_mgmt=flag("test_transaction_mgmt", "TEST_TRANSACTION_MGMT", "true"),
+            test_rule_mgmt=flag("test_rule_mgmt", "TEST_RULE_MGMT", "false"),
+            test_ops_analyst=flag("test_ops_analyst", "TEST_OPS_ANALYST", "false"),
+            rule_engine_mode=(
+                descriptor.get("rule_engine_mode") or os.getenv("RULE_ENGINE_MODE", "auth")
+            ).lower(),
+            pacing=descriptor.get("pacing") or float(os.getenv("LOADTEST_PACING", "0")) or None,
+        )
+
+    @property
+    def enabled_services(self) -> tuple[str, ...]:
+        """Names of the services selected for this run."""
+        flags = (
+            ("rule-engine", self.test_rule_engine),
+            ("transaction-management", self.test_transaction_mgmt),
+            ("rule-management", self.test_rule_mgmt),
+            ("ops-analyst-agent", self.test_ops_analyst),
+        )
+        return tuple(service for service, enabled in flags if enabled)
+
+
+RUN_SETTINGS = RunSettings.load()
+
 # Load service configurations
 SERVICE_CONFIGS = {
     "rule-engine": get_service_config("rule-engine"),
@@ -60,6 +132,13 @@ def on_locust_init(environment, **kwargs):
     if enabled and hasattr(environment, "user_classes"):
         environment.user_classes = enabled
 
+    # Logged here rather than at import: Locust configures logging after loading
+    # the locustfile, and workers would only repeat the master's line.
+    if not isinstance(environment.runner, WorkerRunner):
+        logger.info("Configured services for testing: %s", list(_ENABLED_USERS))
+        if RUN_SETTINGS.pacing:
+            logger.info("Constant pacing: %gs per user", RUN_SETTINGS.pacing)
+
     if isinstance(environment.runner, MasterRunner):
         worker_count = getattr(environment.runner, "worker_count", None)
         if worker_count is None:
@@ -101,23 +180,23 @@ class RuleEngineUser(FastHttpUser):
     """
 
     config = SERVICE_CONFIGS["rule-engine"]
+    connection_timeout = CONNECTION_TIMEOUT_S
+    network_timeout = 5.0
+    default_headers = JSON_HEADERS
     host = (
         RULE_ENGINE_MONITORING_URL
-        if os.getenv("RULE_ENGINE_MODE", "auth").lower() == "monitoring"
+        if RUN_SETTINGS.rule_engine_mode == "monitoring"
         else RULE_ENGINE_AUTH_URL
     )
 
     def on_start(self):
         self.metrics = metrics_collector
+        # Per-user stream, seeded from os.urandom after Locust forks workers
+        self.rng = random.Random()
 
         self.rule_engine_auth_url = RULE_ENGINE_AUTH_URL
         self.rule_engine_monitoring_url = RULE_ENGINE_MONITORING_URL
 
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
-
     tasks = []  # Loaded dynamically based on config
 
 
@@ -131,15 +210,14 @@ class TransactionManagementUser(FastHttpUser):
     """
 
     config = SERVICE_CONFIGS["transaction-management"]
+    connection_timeout = CONNECTION_TIMEOUT_S
+    network_timeout = 5.0
+    default_headers = JSON_HEADERS
     host = TRANSACTION_MGMT_URL
 
     def on_start(self):
         self.metrics = metrics_collector
-
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self.rng = random.Random()
 
     tasks = []  # Loaded dynamically based on config
 
@@ -154,16 +232,15 @@ class RuleManagementUser(FastHttpUser):
     """
 
     config = SERVICE_CONFIGS["rule-management"]
+    connection_timeout = CONNECTION_TIMEOUT_S
+    network_timeout = 10.0
+    default_headers = JSON_HEADERS
     host = RULE_MGMT_URL
     wait_time = between(1.0, 2.0)
 
     def on_start(self):
         self.metrics = metrics_collector
-
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self.rng = random.Random()
 
     tasks = []  # Loaded dynamically based on config
 
@@ -178,16 +255,18 @@ class OpsAnalystUser(FastHttpUser):
     """
 
     config = SERVICE_CONFIGS["ops-analyst-agent"]
+    connection_timeout = CONNECTION_TIMEOUT_S
+    network_timeout = 10.0
+    default_headers = JSON_HEADERS
     host = OPS_ANALYST_URL
+    # Connection pool per user: the running task plus up to 4 background
+    # investigation GETs and a batch of 10 worklist acknowledgements.
+    concurrency = 16
     wait_time = between(0.5, 2.0)
 
     def on_start(self):
         self.metrics = metrics_collector
-
-        self.headers = {
-            "Content-Type": "application/json",
-            "Accept": "application/json",
-        }
+        self.rng = random.Random()
 
     tasks = []  # Loaded dynamically based on config
 
@@ -197,104 +276,67 @@ class OpsAnalystUser(FastHttpUser):
 # =============================================================================
 
 
-def load_tasks_for_service(service_name: str) -> dict:
-    """Load task set for a service based on config."""
-    config = SERVICE_CONFIGS[service_name]
-
-    if service_name == "rule-engine":
-        from tasksets.rule_engine import auth, monitoring
-
-        tasks = {}
-
-        if config.traffic_mix.preauth > 0:
-            tasks[auth.AuthTaskset] = int(config.traffic_mix.preauth * 100)
-        if config.traffic_mix.postauth > 0:
-            tasks[monitoring.MonitoringTaskset] = int(config.traffic_mix.postauth * 100)
-
-        return tasks
-
-    elif service_name == "transaction-management":
-        from tasksets.transaction_mgmt import ingestion
-
-        tasks = {}
-
-        if config.traffic_mix.ingestion > 0:
-            tasks[ingestion.IngestionTaskset] = int(config.traffic_mix.ingestion * 100)
-        if config.traffic_mix.list_query > 0:
-            tasks[ingestion.ListQueryTaskset] = int(config.traffic_mix.list_query * 100)
-
-        return tasks
-
-    elif service_name == "rule-management":
-        from tasksets.rule_management import rules
-
-        tasks = {}
-
-        if config.traffic_mix.list_rules > 0:
-            tasks[rules.ListRulesTaskset] = int(config.traffic_mix.list_rules * 100)
-        if config.traffic_mix.get_rule > 0:
-            tasks[rules.GetRuleTaskset] = int(config.traffic_mix.get_rule * 100)
-
-        return tasks
-
-    elif service_name == "ops-analyst-agent":
-        from tasksets.ops_analyst import investigations, worklist
-
-        tasks = {}
+# Task sets per service: (module, class name, traffic_mix share).
+_SERVICE_TASKS = {
+    "rule-engine": (
+        ("tasksets.rule_engine.auth", "AuthTaskset", "preauth"),
+        ("tasksets.rule_engine.monitoring", "MonitoringTaskset", "postauth"),
+    ),
+    "transaction-management": (
+        ("tasksets.transaction_mgmt.ingestion", "IngestionTaskset", "ingestion"),
+        ("tasksets.transaction_mgmt.ingestion", "ListQueryTaskset", "list_query"),
+    ),
+    "rule-management": (
+        ("tasksets.rule_management.rules", "ListRulesTaskset", "list_rules"),
+        ("tasksets.rule_management.rules", "GetRuleTaskset", "get_rule"),
+    ),
+    "ops-analyst-agent": (
+        ("tasksets.ops_analyst.investigations", "InvestigationTaskset", "investigations"),
+        ("tasksets.ops_analyst.worklist", "WorklistTaskset", "worklist"),
+    ),
+}
 
-        if config.traffic_mix.investigations > 0:
-            tasks[investigations.InvestigationTaskset] = int(
-                config.traffic_mix.investigations * 100
-            )
-        if config.traffic_mix.worklist > 0:
-            tasks[worklist.WorklistTaskset] = int(config.traffic_mix.worklist * 100)
 
-        return tasks
+def load_tasks_for_service(service_name: str) -> dict:
+    """Load task sets for a service, weighted per mille by its traffic mix."""
+    traffic_mix = SERVICE_CONFIGS[service_name].traffic_mix
+    tasks = {}
+    for module_name, class_name, share_name in _SERVICE_TASKS.get(service_name, ()):
+        share = getattr(traffic_mix, share_name)
+        if share > 0:
+            taskset = getattr(importlib.import_module(module_name), class_name)
+            tasks[taskset] = max(1, round(share * 1000))
+    return tasks
+
+
+# Locust user class per service
+_SERVICE_USERS: dict[str, type[FastHttpUser]] = {
+    "rule-engine": RuleEngineUser,
+    "transaction-management": TransactionManagementUser,
+    "rule-management": RuleManagementUser,
+    "ops-analyst-agent": OpsAnalystUser,
+}
 
-    return {}
+# Resolved once from RUN_SETTINGS; both functions below read this mapping
+_ENABLED_USERS = {service: _SERVICE_USERS[service] for service in RUN_SETTINGS.enabled_services}
 
 
-# Load tasks based on environment variables or defaults
+# Load tasks based on the run descriptor, environment variables, or defaults
 def auto_configure():
     """Auto-configure user classes based on what services are configured."""
-    services_to_test = []
-
-    if os.getenv("TEST_RULE_ENGINE", "true").lower() == "true":
-        services_to_test.append("rule-engine")
-        RuleEngineUser.tasks = load_tasks_for_service("rule-engine")
-
-    if os.getenv("TEST_TRANSACTION_MGMT", "true").lower() == "true":
-        services_to_test.append("transaction-management")
-        TransactionManagementUser.tasks = load_tasks_for_service("transaction-management")
-
-    if os.getenv("TEST_RULE_MGMT", "false").lower() == "true":
-        services_to_test.append("rule-management")
-        RuleManagementUser.tasks = load_tasks_for_service("rule-management")
+    for service_name, user_class in _ENABLED_USERS.items():
+        user_class.tasks = load_tasks_for_service(service_name)
 
-    if os.getenv("TEST_OPS_ANALYST", "false").lower() == "true":
-        services_to_test.append("ops-analyst-agent")
-        OpsAnalystUser.tasks = load_tasks_for_service("ops-analyst-agent")
-
-    print(f"Configured services for testing: {services_to_test}")
+    if RUN_SETTINGS.pacing:
+        # Open-loop pacing: start tasks on a fixed cadence rather than after
+        # the previous response plus think time.
+        for user_class in get_enabled_user_classes():
+            user_class.wait_time = constant_pacing(RUN_SETTINGS.pacing)
 
 
 def get_enabled_user_classes():
     """Return the list of user classes enabled for this run."""
-    enabled: list[type[FastHttpUser]] = []
-
-    if os.getenv("TEST_RULE_ENGINE", "true").lower() == "true":
-        enabled.append(RuleEngineUser)
-
-    if os.getenv("TEST_TRANSACTION_MGMT", "true").lower() == "true":
-        enabled.append(TransactionManagementUser)
-
-    if os.getenv("TEST_RULE_MGMT", "false").lower() == "true":
-        enabled.append(RuleManagementUser)
-
-    if os.getenv("TEST_OPS_ANALYST", "false").lower() == "true":
-        enabled.append(OpsAnalystUser)
-
-    return enabled
+    return list(_ENABLED_USERS.values())
 
 
 auto_configure()
@@ -340,24 +382,15 @@ if __name__ == "__main__":
 
     args = parser.parse_args()
 
-    # Build locust arguments
-    locust_args = [
-        "-f",
-        "src/locustfile.py",
-        "--users",
-        str(args.users),
-        "--spawn-rate",
-        str(args.spawn_rate),
-        "--run-time",
-        args.run_time,
-        "--html",
-        "html-reports/locust/index.html",
-        "--csv",
-        "html-reports/locust/results",
-    ]
-
-    if args.headless:
-        locust_args.append("--headless")
+    # Locust options keyed by flag, so scenario overrides replace values
+    # instead of appending duplicate flags
+    opts = {
+        "--users": args.users,
+        "--spawn-rate": args.spawn_rate,
+        "--run-time": args.run_time,
+        "--html": "html-reports/locust/index.html",
+        "--csv": "html-reports/locust/results",
+    }
 
     # Select service(s) via environment variables consumed by auto_configure()
     os.environ["TEST_RULE_ENGINE"] = "true" if args.service in ["all", "rule-engine"] else "false"
@@ -371,18 +404,21 @@ if __name__ == "__main__":
 
     # Adjust config based on scenario
     if args.scenario == "smoke":
-        locust_args.extend(["--users", str(min(args.users, 50)), "--run-time", "2m"])
+        opts.update({"--users": min(args.users, 50), "--run-time": "2m"})
     elif args.scenario == "stress":
-        locust_args.extend(
-            ["--users", str(args.users * 3), "--spawn-rate", str(args.spawn_rate * 2)]
-        )
+        opts.update({"--users": args.users * 3, "--spawn-rate": args.spawn_rate * 2})
     elif args.scenario == "soak":
-        locust_args.extend(["--run-time", "1h"])
+        opts["--run-time"] = "1h"
+
+    locust_args = ["-f", "src/locustfile.py"]
+    locust_args += [item for flag, value in opts.items() for item in (flag, str(value))]
+    if args.headless:
+        locust_args.append("--headless")
 
     print(f"Starting load test: {args.service}")
-    print(f"  Users: {args.users}")
-    print(f"  Spawn rate: {args.spawn_rate}/s")
-    print(f"  Duration: {args.run_time}")
+    print(f"  Users: {opts['--users']}")
+    print(f"  Spawn rate: {opts['--spawn-rate']}/s")
+    print(f"  Duration: {opts['--run-time']}")
     print(f"  Scenario: {args.scenario}")
 
     sys.argv = ["locust"] + locust_args
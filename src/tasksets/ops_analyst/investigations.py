@@ -12,12 +12,16 @@ Priority: MEDIUM-LOW — advisory engine, P99 <= 2s deterministic
 # Pre-seeded transaction IDs inserted by scripts/load_test_data.py.
 # The list is populated at runtime from OPS_ANALYST_TRANSACTION_IDS env var
 # (comma-separated) so no IDs are hardcoded here.
+import itertools
 import os
 import random
 import uuid
 
+from gevent.pool import Pool
 from locust import TaskSet, tag, task
 
+from utilities.jsonio import dumps, loads
+
 _RAW = os.getenv("OPS_ANALYST_TRANSACTION_IDS", "")
 SEEDED_TRANSACTION_IDS: list[str] = [t.strip() for t in _RAW.split(",") if t.strip()]
 
@@ -27,6 +31,21 @@ if not SEEDED_TRANSACTION_IDS:
     SEEDED_TRANSACTION_IDS = [str(uuid.UUID(int=i)) for i in range(1, 6)]
 
 
+def _shuffle_ids() -> None:
+    """Cycle through a fresh shuffle in which every seeded ID appears equally often."""
+    global _TXN_CYCLE
+    ids = SEEDED_TRANSACTION_IDS * 100
+    _TXN_CYCLE = itertools.cycle(random.sample(ids, len(ids)))
+
+
+_shuffle_ids()
+# Locust --processes forks workers after importing the task sets.
+os.register_at_fork(after_in_child=_shuffle_ids)
+
+# Result GETs a single user may have in flight at once
+FOLLOWUP_CONCURRENCY = 4
+
+
 class InvestigationTaskset(TaskSet):
     """
     Exercise the investigation pipeline end-to-end.
@@ -37,46 +56,56 @@ class InvestigationTaskset(TaskSet):
     min_wait = 500  # ms — investigation is heavier than a simple query
     max_wait = 2000
 
+    def on_start(self):
+        # Follow-up GETs belong to this user; on_stop kills any still running
+        self._followups = Pool(FOLLOWUP_CONCURRENCY)
+
+    def on_stop(self):
+        self._followups.kill()
+
     @task(3)
     @tag("investigations", "run")
     def run_investigation(self):
         """Trigger a quick investigation for a random seeded transaction."""
-        txn_id = random.choice(SEEDED_TRANSACTION_IDS)
+        txn_id = next(_TXN_CYCLE)
 
         response = self.client.post(
             "/api/v1/ops-agent/investigations/run",
-            json={"transaction_id": txn_id, "mode": "quick"},
-            headers=self.user.headers,
+            data=dumps({"transaction_id": txn_id, "mode": "quick"}),
             name="POST /api/v1/ops-agent/investigations/run",
         )
 
         if response.status_code in (200, 201):
-            self.user.metrics.increment("investigations_run_success")
+            self.user.metrics.increment_local("investigations_run_success")
             # Follow-up: fetch the result
-            data = response.json()
+            data = loads(response.content)
             run_id = data.get("run_id")
             if run_id:
-                self.client.get(
-                    f"/api/v1/ops-agent/investigations/{run_id}",
-                    headers=self.user.headers,
-                    name="GET /api/v1/ops-agent/investigations/{run_id}",
-                )
-                self.user.metrics.increment("investigations_get_success")
+                # Fetch in the background so the GET overlaps this user's wait;
+                # blocks only while FOLLOWUP_CONCURRENCY GETs are already pending.
+                self._followups.spawn(self._fetch_result, run_id)
         else:
-            self.user.metrics.increment("investigations_run_error")
+            self.user.metrics.increment_local("investigations_run_error")
+
+    def _fetch_result(self, run_id: str):
+        """Fetch an investigation result."""
+        self.client.get(
+            f"/api/v1/ops-agent/investigations/{run_id}",
+            name="GET /api/v1/ops-agent/investigations/{run_id}",
+        )
+        self.user.metrics.increment_local("investigations_get_success")
 
     @task(1)
     @tag("investigations", "insights")
     def get_transaction_insights(self):
         """Fetch insights for a transaction that already has a run."""
-        txn_id = random.choice(SEEDED_TRANSACTION_IDS)
+        txn_id = next(_TXN_CYCLE)
 
         response = self.client.get(
             f"/api/v1/ops-agent/transactions/{txn_id}/insights",
-            headers=self.user.headers,
             name="GET /api/v1/ops-agent/transactions/{id}/insights",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("insights_get_success")
+            self.user.metrics.increment_local("insights_get_success")
 
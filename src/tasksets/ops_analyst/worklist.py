@@ -9,10 +9,33 @@ Priority: MEDIUM-LOW — analyst review queue, low RPS
 """
 
 import random
+import time
 
+import gevent
 from locust import TaskSet, tag, task
 
+from utilities.ids import DrawTable
+from utilities.jsonio import dumps, loads
+
 SEVERITIES = ["HIGH", "MEDIUM", "LOW", None]
+LIMITS = [10, 25, 50]
+
+# Filter values drawn in bulk at import and read in order through a shared counter.
+_DRAWS = DrawTable(1 << 16)
+_LIMIT_DRAWS = tuple(random.choices(LIMITS, k=_DRAWS.size))
+_SEVERITY_DRAWS = tuple(random.choices(SEVERITIES, k=_DRAWS.size))
+
+# The ops agent has no batch acknowledge endpoint, so acknowledgements are
+# collected per user and sent concurrently once this many are pending, or
+# once the oldest has waited ACK_BATCH_MAX_AGE_S. Each listing queues at most
+# one, so the age limit is what usually sends a batch; it is checked on each
+# listing, so a batch can wait longer if the user stops listing.
+ACK_BATCH_SIZE = 10
+ACK_BATCH_MAX_AGE_S = 5.0
+ACK_BATCH_TIMEOUT_S = 10.0
+
+# Every acknowledgement sends the same body, so it is serialized once.
+_ACK_BODY = dumps({"action": "acknowledge", "comment": "Load test acknowledgement"})
 
 
 class WorklistTaskset(TaskSet):
@@ -26,36 +49,48 @@ class WorklistTaskset(TaskSet):
     min_wait = 200
     max_wait = 1000
 
+    def on_start(self):
+        self._pending_acks: list[str] = []
+        self._acks_started = 0.0
+
+    def on_stop(self):
+        # Send what is queued rather than dropping it with the user
+        if self._pending_acks:
+            self._flush_acks()
+
     @task(4)
     @tag("worklist", "list")
     def list_recommendations(self):
         """List open recommendations with optional severity filter."""
-        params: dict = {"limit": random.choice([10, 25, 50])}
+        i = _DRAWS.next_index()
+        params: dict = {"limit": _LIMIT_DRAWS[i]}
 
-        severity = random.choice(SEVERITIES)
+        severity = _SEVERITY_DRAWS[i]
         if severity:
             params["severity"] = severity
 
         response = self.client.get(
             "/api/v1/ops-agent/worklist/recommendations",
             params=params,
-            headers=self.user.headers,
             name="GET /api/v1/ops-agent/worklist/recommendations",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("worklist_list_success")
-            data = response.json()
+            self.user.metrics.increment_local("worklist_list_success")
+            data = loads(response.content)
             items = data.get("recommendations", [])
 
             # Opportunistically acknowledge the first OPEN recommendation found
             for rec in items:
                 if rec.get("status") == "OPEN":
                     rec_id = rec.get("recommendation_id")
-                    if rec_id:
-                        self._acknowledge(rec_id)
+                    if rec_id and rec_id not in self._pending_acks:
+                        self._queue_ack(rec_id)
                     break
 
+        if self._pending_acks and time.monotonic() - self._acks_started >= ACK_BATCH_MAX_AGE_S:
+            self._flush_acks()
+
     @task(1)
     @tag("worklist", "list-paginated")
     def list_recommendations_paginated(self):
@@ -63,14 +98,13 @@ class WorklistTaskset(TaskSet):
         response = self.client.get(
             "/api/v1/ops-agent/worklist/recommendations",
             params={"limit": 10},
-            headers=self.user.headers,
             name="GET /api/v1/ops-agent/worklist/recommendations (page 1)",
         )
 
         if response.status_code != 200:
             return
 
-        data = response.json()
+        data = loads(response.content)
         next_cursor = data.get("next_cursor")
         if not next_cursor:
             return
@@ -78,22 +112,36 @@ class WorklistTaskset(TaskSet):
         self.client.get(
             "/api/v1/ops-agent/worklist/recommendations",
             params={"limit": 10, "cursor": next_cursor},
-            headers=self.user.headers,
             name="GET /api/v1/ops-agent/worklist/recommendations (page 2)",
         )
-        self.user.metrics.increment("worklist_paginated_success")
+        self.user.metrics.increment_local("worklist_paginated_success")
+
+    def _queue_ack(self, recommendation_id: str) -> None:
+        """Queue an acknowledgement and send the batch once it is full."""
+        if not self._pending_acks:
+            self._acks_started = time.monotonic()
+        self._pending_acks.append(recommendation_id)
+        if len(self._pending_acks) >= ACK_BATCH_SIZE:
+            self._flush_acks()
+
+    def _flush_acks(self) -> None:
+        """Send the pending acknowledgements concurrently and wait for them."""
+        pending, self._pending_acks = self._pending_acks, []
+        greenlets = [gevent.spawn(self._acknowledge, rec_id) for rec_id in pending]
+        gevent.joinall(greenlets, timeout=ACK_BATCH_TIMEOUT_S)
+        # Don't leave acknowledgements that outlived the timeout running unowned
+        gevent.killall([g for g in greenlets if not g.ready()])
 
     def _acknowledge(self, recommendation_id: str) -> None:
         """Acknowledge a recommendation (non-destructive test action)."""
         response = self.client.post(
             f"/api/v1/ops-agent/worklist/recommendations/{recommendation_id}/acknowledge",
-            json={"action": "acknowledge", "comment": "Load test acknowledgement"},
-            headers=self.user.headers,
+            data=_ACK_BODY,
             name="POST /api/v1/ops-agent/worklist/recommendations/{id}/acknowledge",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("worklist_acknowledge_success")
+            self.user.metrics.increment_local("worklist_acknowledge_success")
         elif response.status_code == 409:
             # Already acknowledged/rejected — expected during concurrent load test
-            self.user.metrics.increment("worklist_acknowledge_conflict")
+            self.user.metrics.increment_local("worklist_acknowledge_conflict")
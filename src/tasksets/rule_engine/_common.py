@@ -0,0 +1,138 @@
+"""
+Shared payload helpers for the Rule Engine task sets.
+
+Transactions are pre-built and pre-serialized into a fixed ring when a task
+set module is imported, so a task only splices a fresh transaction ID and
+timestamp into ready-made JSON bytes instead of calling Faker, uuid, random
+and a JSON encoder per request.
+"""
+
+import itertools
+import os
+import random
+import time
+from collections.abc import Callable, Iterator
+from datetime import UTC, datetime
+from functools import cache
+
+import numpy as np
+
+from utilities.jsonio import dumps
+
+# Distinct transaction templates kept per task set.
+RING_SIZE = 10_000
+
+CARD_NETWORKS = ("VISA", "MASTERCARD", "AMEX")
+COUNTRIES = ("IN", "US", "SG")
+
+_ID_PREFIX = ""
+_id_counter = itertools.count()
+
+
+def _new_id_prefix() -> None:
+    """Pick this process's ID prefix, keeping counter-based IDs unique per worker."""
+    global _ID_PREFIX
+    _ID_PREFIX = os.urandom(4).hex()
+
+
+_new_id_prefix()
+# Locust --processes forks workers after importing the task sets.
+os.register_at_fork(after_in_child=_new_id_prefix)
+
+
+@cache
+def get_faker():
+    """Return the shared Faker instance, importing Faker and its locale data on first use."""
+    from faker import Faker
+
+    return Faker()
+
+
+@cache
+def _ip_cycle() -> Iterator[str]:
+    """Cycle one pool of RING_SIZE Faker IPv4 addresses shared by every ring."""
+    fake = get_faker()
+    return itertools.cycle(tuple(fake.ipv4() for _ in range(RING_SIZE)))
+
+
+def draw_amounts(
+    tiers: tuple[tuple[float, float, float], ...], size: int = RING_SIZE
+) -> Iterator[float]:
+    """
+    Draw a ring's worth of amounts in one vectorized pass.
+
+    Each tier is (probability, low, high); probabilities must sum to 1.
+    """
+    rng = np.random.default_rng(random.getrandbits(64))
+    weights, lows, highs = np.asarray(tiers, dtype=np.float64).T
+    picked = rng.choice(len(tiers), size=size, p=weights)
+    return iter(np.round(rng.uniform(lows[picked], highs[picked]), 2).tolist())
+
+
+def next_ip() -> str:
+    """Return the next address from the shared IPv4 pool."""
+    return next(_ip_cycle())
+
+
+# LT_VALIDATE=1 checks every response body; otherwise one in 1024 is decoded.
+VALIDATE_RESPONSES = os.getenv("LT_VALIDATE", "0") == "1"
+_VALIDATE_MASK = 0x3FF
+_validate_counter = itertools.count()
+
+
+def should_validate() -> bool:
+    """Return True when this 200 response's body should be decoded and checked."""
+    return VALIDATE_RESPONSES or not next(_validate_counter) & _VALIDATE_MASK
+
+
+def next_transaction_id() -> str:
+    """Return a unique 16-hex-digit transaction ID (process prefix + counter)."""
+    return f"txn_{_ID_PREFIX}{next(_id_counter) & 0xFFFFFFFF:08x}"
+
+
+# Timestamps are reused for this many seconds; requests do not need finer resolution.
+_TS_GRANULARITY = 0.01
+_ts_cache = [b"", 0.0]  # [ISO-8601 bytes, time they were taken]
+
+
+def now_iso() -> bytes:
+    """Return the current UTC time as ISO-8601 bytes, cached at 10ms granularity."""
+    now = time.time()
+    if now - _ts_cache[1] >= _TS_GRANULARITY:
+        _ts_cache[0] = datetime.fromtimestamp(now, UTC).isoformat().encode()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+
+def _split_template(transaction: dict) -> tuple[bytes, bytes, bytes]:
+    """
+    Serialize a template around its transaction_id and timestamp slots.
+
+    The template must leave both fields as None, with transaction_id ahead of
+    timestamp. Returns the static JSON before, between and after the two values.
+    """
+    body = dumps(transaction)
+    head, rest = body.split(b'"transaction_id":null', 1)
+    middle, tail = rest.split(b'"timestamp":null', 1)
+    return head + b'"transaction_id":"', b'"' + middle + b'"timestamp":"', b'"' + tail
+
+
+class PayloadRing:
+    """
+    Cycle through pre-serialized transaction templates.
+
+    Usage:
+        payloads = PayloadRing(build_transaction)
+        body, transaction_id = payloads.next()
+        client.post(url, data=body)
+    """
+
+    def __init__(self, build: Callable[[], dict], size: int = RING_SIZE):
+        self._cycle = itertools.cycle(tuple(_split_template(build()) for _ in range(size)))
+
+    def next(self) -> tuple[bytes, str]:
+        """Return the next JSON body with a fresh ID and timestamp, plus that ID."""
+        head, middle, tail = next(self._cycle)
+        transaction_id = next_transaction_id()
+        body = b"".join((head, transaction_id.encode(), middle, now_iso(), tail))
+        return body, transaction_id
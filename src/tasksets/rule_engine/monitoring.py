@@ -5,12 +5,47 @@ Priority: MEDIUM - Post-authorization monitoring
 Target: 30% of traffic, <100ms p99 latency
 """
 
-from datetime import UTC
+import random
 
-from faker import Faker
 from locust import TaskSet, tag, task
 
-fake = Faker()
+from utilities.ids import hex_ids
+from utilities.jsonio import loads
+
+from ._common import (
+    CARD_NETWORKS,
+    COUNTRIES,
+    PayloadRing,
+    draw_amounts,
+    next_ip,
+    should_validate,
+)
+
+_DECISIONS = ("APPROVE", "DECLINE")
+
+# Varied amounts: 80% normal (100-5000), 20% high (500-50000)
+_AMOUNTS = draw_amounts(((0.80, 100, 5000), (0.20, 500, 50000)))
+
+
+def _build_transaction() -> dict:
+    """Build a transaction template with varied amounts."""
+    return {
+        "transaction_id": None,
+        "card_hash": f"card_{hex_ids.take(6)}",
+        "card_network": random.choice(CARD_NETWORKS),
+        "merchant_id": f"M{random.randint(10000, 99999)}",
+        "ip_address": next_ip(),
+        "amount": next(_AMOUNTS),
+        "currency": "USD",
+        "country_code": random.choice(COUNTRIES),
+        "transaction_type": "PURCHASE",
+        "decision": random.choice(_DECISIONS),
+        "timestamp": None,
+    }
+
+
+# Bound once so tasks call a plain function, not a method on self
+_next_transaction = PayloadRing(_build_transaction).next
 
 
 class MonitoringTaskset(TaskSet):
@@ -28,43 +63,16 @@ class MonitoringTaskset(TaskSet):
     @tag("monitoring", "medium-priority")
     def evaluate_monitoring(self):
         """MONITORING evaluation for post-authorization analysis."""
-        transaction = self._generate_transaction()
+        body, _transaction_id = _next_transaction()
 
         response = self.client.post(
             f"{self.user.rule_engine_monitoring_url}/v1/evaluate/monitoring",
-            json=transaction,
-            headers=self.user.headers,
+            data=body,
             name="POST /v1/evaluate/monitoring",
         )
 
         if response.status_code == 200:
-            data = response.json()
-            assert "decision" in data
-            self.user.metrics.increment("monitoring_success")
-
-    def _generate_transaction(self) -> dict:
-        """Generate a test transaction with varied amounts."""
-        import random
-        import uuid
-        from datetime import datetime
-
-        # Varied amounts: 80% normal (100-5000), 20% high (500-50000)
-        if random.random() < 0.80:
-            amount = round(random.uniform(100, 5000), 2)
-        else:
-            amount = round(random.uniform(500, 50000), 2)
-
-        return {
-            "transaction_id": f"txn_{uuid.uuid4().hex[:16]}",
-            "card_hash": f"card_{uuid.uuid4().hex[:12]}",
-            "card_network": random.choice(["VISA", "MASTERCARD", "AMEX"]),
-            "merchant_id": f"M{random.randint(10000, 99999)}",
-            "ip_address": fake.ipv4(),
-            "amount": amount,
-            "currency": "USD",
-            "country_code": random.choice(["IN", "US", "SG"]),
-            "transaction_type": "PURCHASE",
-            "decision": random.choice(["APPROVE", "DECLINE"]),
-            "timestamp": datetime.now(UTC).isoformat(),
-        }
-
+            if should_validate():
+                data = loads(response.content)
+                assert "decision" in data
+            self.user.metrics.increment_local("monitoring_success")
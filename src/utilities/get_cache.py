@@ -0,0 +1,59 @@
+"""
+Client-side cache of recent read-only GETs.
+
+Lets read-mostly listing and analytics tasks skip a request whose identical
+predecessor succeeded a few seconds ago. Off unless LOADTEST_CLIENT_CACHE=1,
+so by default every task still reaches the service under test.
+"""
+
+import os
+import time
+from collections import OrderedDict
+from collections.abc import Hashable
+
+CLIENT_CACHE_ENABLED = os.getenv("LOADTEST_CLIENT_CACHE", "0") == "1"
+
+
+class GetCache:
+    """
+    LRU of GET keys that succeeded within the last ttl_s seconds.
+
+    Only the fetch time is kept; tasks never read cached bodies.
+
+    Usage:
+        listings = GetCache(ttl_s=5.0)
+        key = ("/api/v1/rules", rule_type)
+        if listings.hit(key):
+            return
+        response = client.get(...)
+        if response.status_code == 200:
+            listings.store(key)
+    """
+
+    def __init__(self, ttl_s: float, maxsize: int = 1024, enabled: bool = CLIENT_CACHE_ENABLED):
+        self.ttl_s = ttl_s
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._fetched: OrderedDict[Hashable, float] = OrderedDict()
+
+    def hit(self, key: Hashable) -> bool:
+        """Return True if key was stored less than ttl_s seconds ago."""
+        if not self.enabled:
+            return False
+        fetched = self._fetched.get(key)
+        if fetched is None:
+            return False
+        if time.monotonic() - fetched >= self.ttl_s:
+            del self._fetched[key]
+            return False
+        self._fetched.move_to_end(key)
+        return True
+
+    def store(self, key: Hashable) -> None:
+        """Record a successful fetch of key, evicting the least recent past maxsize."""
+        if not self.enabled:
+            return
+        self._fetched[key] = time.monotonic()
+        self._fetched.move_to_end(key)
+        if len(self._fetched) > self.maxsize:
+            self._fetched.popitem(last=False)
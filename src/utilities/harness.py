@@ -16,25 +16,36 @@ Usage:
     harness.teardown()
 """
 
-import json
 import os
-import uuid
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
 
 try:
     # Package-style imports (used by console script entry points).
+    from src.utilities.jsonio import write_json
     from src.utilities.minio_client import (
         cleanup_run_artifacts,
-        publish_ruleset,
-        verify_artifact_exists,
+        publish_rulesets,
+        verify_artifacts_exist,
+    )
+    from src.utilities.run_descriptor import (  # noqa: F401 - re-exported
+        load_run_descriptor,
+        run_descriptor_path,
+        write_run_descriptor,
     )
 except ModuleNotFoundError:
     # Backward-compatible imports when running with src on PYTHONPATH.
+    from utilities.jsonio import write_json
     from utilities.minio_client import (
         cleanup_run_artifacts,
-        publish_ruleset,
-        verify_artifact_exists,
+        publish_rulesets,
+        verify_artifacts_exist,
+    )
+    from utilities.run_descriptor import (  # noqa: F401 - re-exported
+        load_run_descriptor,
+        run_descriptor_path,
+        write_run_descriptor,
     )
 
 HEALTH_PATH_BY_SERVICE = {
@@ -68,7 +79,7 @@ class LoadTestHarness:
             enable_seed: Whether to run seed phase
             enable_teardown: Whether to run teardown phase
         """
-        self.run_id = run_id or f"lt-{uuid.uuid4().hex[:12]}"
+        self.run_id = run_id or create_run_id()
         self.bucket = bucket
         self.enable_seed = enable_seed
         self.enable_teardown = enable_teardown
@@ -101,8 +112,9 @@ class LoadTestHarness:
         # Publish rulesets
         if rulesets:
             print(f"\nPublishing {len(rulesets)} rulesets...")
-            for ruleset in rulesets:
-                key = publish_ruleset(ruleset, self.bucket, self.run_id)
+            # Published concurrently; keys come back in ruleset order
+            keys = publish_rulesets(rulesets, self.bucket, self.run_id)
+            for ruleset, key in zip(rulesets, keys, strict=True):
                 if key:
                     self.seeded_artifacts.append(key)
 
@@ -135,8 +147,8 @@ class LoadTestHarness:
         # not under loadtest/{run_id}/..., so listing by run_id prefix is unreliable.
         visible = []
         missing = []
-        for key in self.seeded_artifacts:
-            if verify_artifact_exists(self.bucket, key):
+        for key, exists in verify_artifacts_exist(self.bucket, self.seeded_artifacts).items():
+            if exists:
                 visible.append(key)
             else:
                 missing.append(key)
@@ -166,23 +178,33 @@ class LoadTestHarness:
         import httpx
 
         results = {}
+        health_urls = {
+            name: f"{url.rstrip('/')}{HEALTH_PATH_BY_SERVICE.get(name, '/health')}"
+            for name, url in service_urls.items()
+        }
 
         print("\nHealth checking services...")
-        for name, url in service_urls.items():
-            health_path = HEALTH_PATH_BY_SERVICE.get(name, "/health")
-            health_url = f"{url.rstrip('/')}{health_path}"
-            try:
-                response = httpx.get(health_url, timeout=5.0)
-                healthy = response.status_code == 200
-                results[name] = {
-                    "healthy": healthy,
-                    "status_code": response.status_code,
-                }
-                status = "[OK]" if healthy else "[FAIL]"
-                print(f"  {status} {name}: {health_url}")
-            except Exception as exc:
-                results[name] = {"healthy": False, "error": str(exc)}
-                print(f"  [FAIL] {name}: {health_url} - {exc}")
+        # One pooled client shared by concurrent probes, so the phase waits for
+        # the slowest service rather than the sum of all of them.
+        with (
+            httpx.Client(timeout=5.0) as client,
+            ThreadPoolExecutor(max_workers=max(1, len(health_urls))) as pool,
+        ):
+            futures = {name: pool.submit(client.get, url) for name, url in health_urls.items()}
+            for name, future in futures.items():
+                health_url = health_urls[name]
+                try:
+                    response = future.result()
+                    healthy = response.status_code == 200
+                    results[name] = {
+                        "healthy": healthy,
+                        "status_code": response.status_code,
+                    }
+                    status = "[OK]" if healthy else "[FAIL]"
+                    print(f"  {status} {name}: {health_url}")
+                except Exception as exc:
+                    results[name] = {"healthy": False, "error": str(exc)}
+                    print(f"  [FAIL] {name}: {health_url} - {exc}")
 
         return results
 
@@ -253,15 +275,14 @@ class LoadTestHarness:
             base_metadata.update(metadata)
 
         metadata_file = output_path / f"run-metadata-{self.run_id}.json"
-        with open(metadata_file, "w") as f:
-            json.dump(base_metadata, f, indent=2)
+        write_json(metadata_file, base_metadata, indent=True)
 
         return metadata_file
 
 
 def create_run_id() -> str:
     """Generate a unique run ID."""
-    return f"lt-{uuid.uuid4().hex[:12]}"
+    return f"lt-{os.urandom(6).hex()}"
 
 
 def get_env_run_id() -> str | None:
@@ -0,0 +1,116 @@
+"""
+Random hex IDs for generated load-test payloads, and caches of IDs read back
+from the services under test.
+
+HexPool reads os.urandom in large blocks and slices IDs out of the buffer, so
+building an ID costs no syscall and no uuid4 object. DrawTable does the same
+for other random field values.
+"""
+
+import itertools
+import os
+import random
+from collections import deque
+from collections.abc import Iterable
+
+
+class HexPool:
+    """
+    Hand out random hex strings from a bulk-read os.urandom buffer.
+
+    Usage:
+        ids = HexPool()
+        txn_id = f"txn_{ids.take(8)}"  # 16 hex characters
+    """
+
+    def __init__(self, buffer_size: int = 1 << 16):
+        self.buffer_size = buffer_size
+        self._hex = ""
+        self._offset = 0
+        # A forked Locust worker must not replay its parent's buffer.
+        os.register_at_fork(after_in_child=self._discard)
+
+    def _discard(self) -> None:
+        self._hex = ""
+        self._offset = 0
+
+    def take(self, nbytes: int) -> str:
+        """Return 2 * nbytes random hex characters."""
+        width = nbytes * 2
+        start = self._offset
+        if start + width > len(self._hex):
+            self._hex = os.urandom(self.buffer_size).hex()
+            start = 0
+        self._offset = start + width
+        return self._hex[start : start + width]
+
+
+# Shared pool for every task set in this process
+hex_ids = HexPool()
+
+
+class DrawTable:
+    """
+    Row index into field values drawn in bulk at import.
+
+    Task sets build one tuple of size random values per field and read them
+    back at the same index, so a task draws a whole set of fields with one
+    counter step.
+
+    Usage:
+        draws = DrawTable(1 << 12)
+        LIMIT_DRAWS = tuple(random.choices(LIMITS, k=draws.size))
+        limit = LIMIT_DRAWS[draws.next_index()]
+    """
+
+    def __init__(self, size: int):
+        if size <= 0 or size & (size - 1):
+            raise ValueError(f"size must be a power of two, got {size}")
+        self.size = size
+        self._mask = size - 1
+        self._index = itertools.count()
+        # Locust --processes forks workers after importing the task sets, and
+        # each must not replay its parent's sequence.
+        os.register_at_fork(after_in_child=self._restart)
+
+    def _restart(self) -> None:
+        self._index = itertools.count(random.randrange(self.size))
+
+    def next_index(self) -> int:
+        """Return the next row index, wrapping at size."""
+        return next(self._index) & self._mask
+
+
+class IdCache:
+    """
+    Bounded cache of existing resource IDs, refilled by an occasional list call.
+
+    Lets a "get by ID" task skip the list request it would otherwise make
+    first. Locust users share one gevent thread, so no lock is needed.
+
+    Usage:
+        rule_ids = IdCache()
+        if rule_ids.needs_refresh(rng):
+            rule_ids.extend(ids_from_list_response)
+        rule_id = rule_ids.pick(rng)
+    """
+
+    def __init__(self, maxlen: int = 500, refresh_probability: float = 0.01):
+        self.maxlen = maxlen
+        self.refresh_probability = refresh_probability
+        self._ids: deque[str] = deque(maxlen=maxlen)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def needs_refresh(self, rng: random.Random) -> bool:
+        """Return True when the cache is empty or this call drew a refresh."""
+        return not self._ids or rng.random() < self.refresh_probability
+
+    def extend(self, ids: Iterable[str | None]) -> None:
+        """Add IDs, skipping empty ones; the oldest fall out past maxlen."""
+        self._ids.extend(i for i in ids if i)
+
+    def pick(self, rng: random.Random) -> str | None:
+        """Return a random cached ID, or None if the cache is empty."""
+        return rng.choice(self._ids) if self._ids else None
@@ -0,0 +1,184 @@
+"""
+JSON serialization helpers.
+
+Uses orjson when it is installed and falls back to the stdlib json module,
+so callers get the fast path without a hard dependency.
+"""
+
+import dataclasses
+import json
+import shutil
+from collections.abc import Iterator
+from datetime import date
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _stdlib_default(obj):
+    """Encode the types orjson handles natively: dataclasses and datetimes."""
+    if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+        return dataclasses.asdict(obj)
+    if isinstance(obj, date):
+        return obj.isoformat()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def dumps(obj, indent: bool = False) -> bytes:
+    """Serialize an object, including dataclasses and datetimes, to UTF-8 JSON bytes."""
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS
+        if indent:
+            option |= orjson.OPT_INDENT_2
+        return orjson.dumps(obj, option=option)
+
+    # Like orjson, emit non-ASCII as UTF-8 rather than \u escapes.
+    if indent:
+        return json.dumps(obj, indent=2, ensure_ascii=False, default=_stdlib_default).encode(
+            "utf-8"
+        )
+    return json.dumps(
+        obj, separators=(",", ":"), ensure_ascii=False, default=_stdlib_default
+    ).encode("utf-8")
+
+
+def loads(data: bytes | str):
+    """Parse JSON from bytes or str."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def write_json(path: str | Path, obj, indent: bool = False) -> None:
+    """Serialize an object and write it to disk in a single call."""
+    Path(path).write_bytes(dumps(obj, indent=indent))
+
+
+def read_json(path: str | Path):
+    """Read and parse a JSON file."""
+    return loads(Path(path).read_bytes())
+
+
+def iter_records(path: str | Path) -> Iterator:
+    """
+    Yield records from a JSON Lines file, or from a JSON array file.
+
+    Files ending in .jsonl are parsed one line at a time; anything else is
+    treated as a JSON array and parsed in one go.
+    """
+    path = Path(path)
+    if path.suffix != ".jsonl":
+        yield from read_json(path)
+        return
+
+    with open(path, "rb", buffering=1 << 20) as f:
+        for line in f:
+            if line.strip():
+                yield loads(line)
+
+
+def read_records(path: str | Path) -> list:
+    """Read every record from a JSON or JSON Lines file into a list."""
+    return list(iter_records(path))
+
+
+def convert_records(src: str | Path, dst: str | Path, indent: bool = False) -> int:
+    """
+    Convert a JSON Lines file to a JSON array file, or the reverse.
+
+    The direction follows the destination suffix: .jsonl writes JSON Lines,
+    anything else writes a JSON array.
+
+    Returns:
+        Number of records written
+    """
+    with RecordWriter(dst, jsonl=Path(dst).suffix == ".jsonl", indent=indent) as writer:
+        for record in iter_records(src):
+            writer.write(record)
+    return writer.count
+
+
+class RecordWriter:
+    """
+    Stream records to disk through a single buffered binary file.
+
+    Records are serialized one at a time as they are written, so callers can
+    feed a generator without holding the whole dataset in memory. In JSON mode
+    the output is one array; in JSON Lines mode it is one record per line.
+    With fragment=True the array brackets are left off so several part files
+    can be joined with merge_record_parts.
+
+    Usage:
+        with RecordWriter("fixtures/transactions.jsonl", jsonl=True) as writer:
+            for record in records:
+                writer.write(record)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        jsonl: bool = False,
+        indent: bool = False,
+        fragment: bool = False,
+        buffering: int = 1 << 20,
+    ):
+        self.path = Path(path)
+        self.jsonl = jsonl
+        self.indent = indent and not jsonl
+        self.fragment = fragment
+        self.buffering = buffering
+        self.count = 0
+        self._file = None
+
+    def __enter__(self):
+        self._file = open(self.path, "wb", buffering=self.buffering)
+        if not self.jsonl and not self.fragment:
+            self._file.write(b"[")
+        return self
+
+    def write(self, record) -> None:
+        """Serialize and append a single record."""
+        data = dumps(record, indent=self.indent)
+        if self.jsonl:
+            self._file.write(data + b"\n")
+        elif self.indent:
+            # Nest each pretty-printed record one level inside the array.
+            sep = b",\n  " if self.count else b"\n  "
+            self._file.write(sep + data.replace(b"\n", b"\n  "))
+        else:
+            self._file.write(b"," + data if self.count else data)
+        self.count += 1
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        if not self.jsonl and not self.fragment:
+            self._file.write(b"\n]" if self.indent and self.count else b"]")
+        self._file.close()
+        return False
+
+
+def merge_record_parts(
+    path: str | Path, parts: list[Path], jsonl: bool = False, indent: bool = False
+) -> None:
+    """
+    Concatenate fragment files written by RecordWriter into one output file.
+
+    Part files are removed once copied.
+    """
+    indent = indent and not jsonl
+    wrote = False
+    with open(path, "wb", buffering=1 << 20) as out:
+        if not jsonl:
+            out.write(b"[")
+        for part in parts:
+            if part.stat().st_size:
+                if wrote and not jsonl:
+                    out.write(b",")
+                with open(part, "rb") as src:
+                    shutil.copyfileobj(src, out, 1 << 20)
+                wrote = True
+            part.unlink()
+        if not jsonl:
+            out.write(b"\n]" if indent and wrote else b"]")
@@ -6,12 +6,15 @@ Provides metrics collection and threshold monitoring for SLO enforcement.
 
 import threading
 import time
-from collections import defaultdict
+from collections import Counter, defaultdict
 from collections.abc import Callable
 from dataclasses import dataclass, field
 
+# Independent locks the metrics are spread across by name
+_LOCK_STRIPES = 16
 
-@dataclass
+
+@dataclass(slots=True)
 class MetricThreshold:
     """Threshold configuration for a metric."""
 
@@ -22,9 +25,19 @@ class MetricThreshold:
     rps_min: float | None = None
 
 
-@dataclass
+def _bucket(elapsed_ms: float) -> float:
+    """Round a latency to three significant figures, its histogram bucket."""
+    return float(f"{elapsed_ms:.3g}")
+
+
+@dataclass(slots=True)
 class MetricSnapshot:
-    """Snapshot of metric statistics."""
+    """
+    Snapshot of metric statistics.
+
+    response_times is a histogram of latency bucket -> observation count, so its
+    size is bounded by the latency range rather than the number of requests.
+    """
 
     name: str
     count: int = 0
@@ -32,8 +45,32 @@ class MetricSnapshot:
     min_time_ms: float = float("inf")
     max_time_ms: float = 0.0
     errors: int = 0
-    timestamps: list[float] = field(default_factory=list)
-    response_times: list[float] = field(default_factory=list)
+    response_times: Counter[float] = field(default_factory=Counter)
+
+    def percentile(self, fraction: float) -> float:
+        """Return the latency (ms) at the given fraction (0-1) of timed observations."""
+        return self.percentiles(fraction)[0]
+
+    def percentiles(self, *fractions: float) -> tuple[float, ...]:
+        """Return the latency (ms) at each fraction, in one pass over the sorted buckets."""
+        histogram = self.response_times.copy()
+        n = histogram.total()
+        if n == 0:
+            return (0.0,) * len(fractions)
+
+        ranks = sorted((min(int(n * f), n - 1), i) for i, f in enumerate(fractions))
+        results = [self.max_time_ms] * len(fractions)
+        pending = iter(ranks)
+        rank, index = next(pending)
+        seen = 0
+        for value in sorted(histogram):
+            seen += histogram[value]
+            while seen > rank:
+                results[index] = value
+                rank, index = next(pending, (n, None))
+            if index is None:
+                break
+        return tuple(results)
 
 
 class MetricsCollector:
@@ -48,13 +85,16 @@ class MetricsCollector:
             # do work
 
         metrics.increment("my_counter")
+        metrics.increment_local("my_hot_counter")  # per-request counters
     """
 
     def __init__(self):
-        self._metrics: dict[str, MetricSnapshot] = defaultdict(
-            lambda: MetricSnapshot(name="unknown")
-        )
+        self._metrics: dict[str, MetricSnapshot] = {}
+        # Per-metric updates take one stripe; _lock guards whole-collector operations.
+        self._stripes = tuple(threading.Lock() for _ in range(_LOCK_STRIPES))
         self._lock = threading.Lock()
+        # Lock-free increments from increment_local, merged into _metrics on read.
+        self._local_counts: dict[str, int] = defaultdict(int)
         self._environment = None
         self._thresholds: list[MetricThreshold] = []
         self._violation_handlers: list[Callable] = []
@@ -71,45 +111,75 @@ class MetricsCollector:
         """Register a handler to be called when thresholds are violated."""
         self._violation_handlers.append(handler)
 
+    def _lock_for(self, metric_name: str) -> threading.Lock:
+        """Return the stripe lock guarding a metric's snapshot."""
+        return self._stripes[hash(metric_name) & (_LOCK_STRIPES - 1)]
+
+    def _add_snapshot(self, metric_name: str) -> MetricSnapshot:
+        """Create the snapshot for a metric on first use (its stripe lock held)."""
+        snapshot = self._metrics[metric_name] = MetricSnapshot(name=metric_name)
+        return snapshot
+
     def timer(self, metric_name: str):
         """Context manager for timing operations."""
         return TimerContext(self, metric_name)
 
     def record_time(self, metric_name: str, elapsed_ms: float, success: bool = True):
         """Record a timing measurement."""
-        with self._lock:
-            snapshot = self._metrics[metric_name]
-            snapshot.name = metric_name
+        with self._lock_for(metric_name):
+            snapshot = self._metrics.get(metric_name) or self._add_snapshot(metric_name)
             snapshot.count += 1
             snapshot.total_time_ms += elapsed_ms
-            snapshot.min_time_ms = min(snapshot.min_time_ms, elapsed_ms)
-            snapshot.max_time_ms = max(snapshot.max_time_ms, elapsed_ms)
-            snapshot.response_times.append(elapsed_ms)
+            if elapsed_ms < snapshot.min_time_ms:
+                snapshot.min_time_ms = elapsed_ms
+            if elapsed_ms > snapshot.max_time_ms:
+                snapshot.max_time_ms = elapsed_ms
+            snapshot.response_times[_bucket(elapsed_ms)] += 1
 
             if not success:
                 snapshot.errors += 1
 
     def increment(self, metric_name: str, value: int = 1):
         """Increment a counter metric."""
-        with self._lock:
-            snapshot = self._metrics[metric_name]
-            snapshot.name = metric_name
+        with self._lock_for(metric_name):
+            snapshot = self._metrics.get(metric_name) or self._add_snapshot(metric_name)
             snapshot.count += value
 
+    def increment_local(self, metric_name: str, value: int = 1):
+        """
+        Increment a counter without taking the lock.
+
+        Counts accumulate in a plain dict and are merged in when stats are read.
+        Locust's gevent users all run on one OS thread, so per-request task
+        counters use this instead of increment().
+        """
+        self._local_counts[metric_name] += value
+
+    def _merge_local_counts(self):
+        """Fold pending increment_local counts into the snapshots."""
+        with self._lock:
+            if not self._local_counts:
+                return
+            counts, self._local_counts = self._local_counts, defaultdict(int)
+        for metric_name, value in counts.items():
+            with self._lock_for(metric_name):
+                snapshot = self._metrics.get(metric_name) or self._add_snapshot(metric_name)
+                snapshot.count += value
+
     def record_error(self, metric_name: str):
         """Record an error for a metric."""
-        with self._lock:
-            snapshot = self._metrics[metric_name]
-            snapshot.name = metric_name
+        with self._lock_for(metric_name):
+            snapshot = self._metrics.get(metric_name) or self._add_snapshot(metric_name)
             snapshot.errors += 1
 
     def get_stats(self, metric_name: str) -> MetricSnapshot | None:
         """Get statistics for a metric."""
-        with self._lock:
-            return self._metrics.get(metric_name)
+        self._merge_local_counts()
+        return self._metrics.get(metric_name)
 
     def get_all_stats(self) -> dict[str, MetricSnapshot]:
         """Get all metric statistics."""
+        self._merge_local_counts()
         with self._lock:
             return dict(self._metrics)
 
@@ -123,14 +193,7 @@ class MetricsCollector:
                 continue
 
             # Calculate percentiles
-            sorted_times = sorted(stats.response_times)
-            n = len(sorted_times)
-
-            p95_idx = int(n * 0.95)
-            p99_idx = int(n * 0.99)
-
-            p95 = sorted_times[p95_idx] if n > 0 else 0
-            p99 = sorted_times[p99_idx] if n > 0 else 0
+            p95, p99 = stats.percentiles(0.95, 0.99)
             error_rate = stats.errors / stats.count if stats.count > 0 else 0
 
             # Check thresholds
@@ -173,7 +236,14 @@ class MetricsCollector:
     def reset(self):
         """Reset all metrics."""
         with self._lock:
-            self._metrics.clear()
+            for stripe in self._stripes:
+                stripe.acquire()
+            try:
+                self._metrics.clear()
+                self._local_counts.clear()
+            finally:
+                for stripe in self._stripes:
+                    stripe.release()
 
 
 class TimerContext:
@@ -4,13 +4,18 @@ MinIO client utilities for artifact publishing and management.
 Supports publishing rulesets, rules, and other artifacts to MinIO/S3 storage.
 """
 
+import io
 import json
+import logging
 import os
-from datetime import datetime
-from uuid import uuid4
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime
+from functools import cache
 
 try:
     import boto3
+    from boto3.s3.transfer import TransferConfig
     from botocore.client import Config
     from botocore.exceptions import ClientError
 except ImportError:
@@ -18,9 +23,47 @@ except ImportError:
 
 import hashlib
 
+try:
+    # Package-style imports (used by console script entry points).
+    from src.utilities.jsonio import dumps
+except ModuleNotFoundError:
+    # Backward-compatible imports when running with src on PYTHONPATH.
+    from utilities.jsonio import dumps
+
+logger = logging.getLogger(__name__)
+
+# S3 returns at most this many keys per ListObjectsV2 page and accepts at
+# most this many per DeleteObjects request.
+_PAGE_SIZE = 1000
+# DeleteObjects requests a cleanup keeps in flight at once.
+_DELETE_WORKERS = 8
+
+# Rulesets publish_rulesets uploads at once.
+_PUBLISH_WORKERS = 20
+
+# Artifacts at least this large are sent as concurrent multipart uploads;
+# smaller ones stay a single PutObject.
+_MULTIPART_THRESHOLD = 8 * 1024 * 1024
+_TRANSFER_CONFIG = (
+    TransferConfig(
+        multipart_threshold=_MULTIPART_THRESHOLD,
+        multipart_chunksize=_MULTIPART_THRESHOLD,
+        max_concurrency=10,
+    )
+    if boto3 is not None
+    else None
+)
+
 
+@cache
 def get_minio_client():
-    """Create and return a MinIO/boto3 client."""
+    """
+    Return the shared MinIO/boto3 client, creating it on first use.
+
+    boto3 clients are thread-safe, so every helper and the harness's publish
+    threads reuse this one client and its connection pool. Settings are read
+    from the environment on the first call only.
+    """
     if boto3 is None:
         raise ImportError("boto3 is required for MinIO operations. Install with: uv add boto3")
 
@@ -28,6 +71,7 @@ def get_minio_client():
     access_key = os.getenv("S3_ACCESS_KEY_ID") or os.getenv("MINIO_ACCESS_KEY", "minioadmin")
     secret_key = os.getenv("S3_SECRET_ACCESS_KEY") or os.getenv("MINIO_SECRET_KEY", "minioadmin")
     secure = os.getenv("MINIO_SECURE", "false").lower() == "true"
+    pool_size = int(os.getenv("S3_POOL_SIZE", "50"))
 
     # Accept both host:port and full URL.
     if endpoint.startswith("http://") or endpoint.startswith("https://"):
@@ -35,13 +79,21 @@ def get_minio_client():
     else:
         endpoint_url = f"{'https' if secure else 'http'}://{endpoint}"
 
-    # Configure boto3 for MinIO
-    s3_client = boto3.client(
+    # Configure boto3 for MinIO. A private session avoids racing on boto3's
+    # default session if several threads make the first call together.
+    s3_client = boto3.session.Session().client(
         "s3",
         endpoint_url=endpoint_url,
         aws_access_key_id=access_key,
         aws_secret_access_key=secret_key,
-        config=Config(signature_version="s3v4"),
+        config=Config(
+            signature_version="s3v4",
+            max_pool_connections=pool_size,
+            retries={"max_attempts": 3, "mode": "standard"},
+            # botocore already sets TCP_NODELAY; keepalive stops idle pooled
+            # connections from being dropped between seed and teardown.
+            tcp_keepalive=True,
+        ),
         region_name="us-east-1",  # MinIO ignores this but boto3 requires it
     )
 
@@ -51,7 +103,7 @@ def get_minio_client():
 def upload_artifact(
     bucket: str,
     key: str,
-    data: dict,
+    data: dict | bytes,
     metadata: dict | None = None,
     content_type: str = "application/json",
 ) -> bool:
@@ -61,7 +113,7 @@ def upload_artifact(
     Args:
         bucket: S3 bucket name
         key: Object key/path
-        data: JSON-serializable data to upload
+        data: JSON-serializable data, or JSON bytes to upload unchanged
         metadata: Optional metadata dict
         content_type: MIME type
 
@@ -71,8 +123,8 @@ def upload_artifact(
     try:
         client = get_minio_client()
 
-        # Serialize data
-        body = json.dumps(data, indent=2).encode("utf-8")
+        # Serialize data as compact JSON
+        body = data if isinstance(data, bytes) else dumps(data)
 
         # Prepare metadata
         extra_args = {"ContentType": content_type}
@@ -80,19 +132,29 @@ def upload_artifact(
             # S3 metadata keys must be prefixed with x-amz-meta-
             extra_args["Metadata"] = {f"x-amz-meta-{k}": str(v) for k, v in metadata.items()}
 
-        # Upload
-        client.put_object(
-            Bucket=bucket,
-            Key=key,
-            Body=body,
-            **extra_args,
-        )
-
-        print(f"Uploaded artifact: s3://{bucket}/{key}")
+        # Upload. upload_fileobj starts its own transfer threads, so it is
+        # only worth it once the body is split into parts.
+        if len(body) < _MULTIPART_THRESHOLD:
+            client.put_object(
+                Bucket=bucket,
+                Key=key,
+                Body=body,
+                **extra_args,
+            )
+        else:
+            client.upload_fileobj(
+                io.BytesIO(body),
+                bucket,
+                key,
+                ExtraArgs=extra_args,
+                Config=_TRANSFER_CONFIG,
+            )
+
+        logger.debug("Uploaded artifact: s3://%s/%s", bucket, key)
         return True
 
     except Exception as e:
-        print(f"Error uploading artifact to s3://{bucket}/{key}: {e}")
+        logger.error("Error uploading artifact to s3://%s/%s: %s", bucket, key, e)
         return False
 
 
@@ -117,16 +179,42 @@ def download_artifact(bucket: str, key: str) -> dict | None:
 
     except ClientError as e:
         if e.response["Error"]["Code"] == "NoSuchKey":
-            print(f"Artifact not found: s3://{bucket}/{key}")
+            logger.warning("Artifact not found: s3://%s/%s", bucket, key)
         else:
-            print(f"Error downloading artifact s3://{bucket}/{key}: {e}")
+            logger.error("Error downloading artifact s3://%s/%s: %s", bucket, key, e)
         return None
 
     except Exception as e:
-        print(f"Error downloading artifact s3://{bucket}/{key}: {e}")
+        logger.error("Error downloading artifact s3://%s/%s: %s", bucket, key, e)
         return None
 
 
+def _iter_key_pages(bucket: str, prefix: str) -> Iterator[list[str]]:
+    """Yield artifact keys one ListObjectsV2 page (up to _PAGE_SIZE keys) at a time."""
+    paginator = get_minio_client().get_paginator("list_objects_v2")
+    for page in paginator.paginate(
+        Bucket=bucket, Prefix=prefix, PaginationConfig={"PageSize": _PAGE_SIZE}
+    ):
+        yield [obj["Key"] for obj in page.get("Contents", [])]
+
+
+def iter_artifacts(bucket: str, prefix: str = "") -> Iterator[str]:
+    """
+    Lazily iterate over every artifact key under a prefix, page by page.
+
+    Unlike list_artifacts, S3 errors are raised to the caller.
+
+    Args:
+        bucket: S3 bucket name
+        prefix: Key prefix filter
+
+    Yields:
+        Artifact keys
+    """
+    for keys in _iter_key_pages(bucket, prefix):
+        yield from keys
+
+
 def list_artifacts(bucket: str, prefix: str = "") -> list:
     """
     List artifacts in a bucket with optional prefix.
@@ -136,18 +224,13 @@ def list_artifacts(bucket: str, prefix: str = "") -> list:
         prefix: Key prefix filter
 
     Returns:
-        List of artifact keys
+        List of artifact keys, across all result pages
     """
     try:
-        client = get_minio_client()
-
-        response = client.list_objects_v2(Bucket=bucket, Prefix=prefix)
-        keys = [obj["Key"] for obj in response.get("Contents", [])]
-
-        return keys
+        return list(iter_artifacts(bucket, prefix))
 
     except Exception as e:
-        print(f"Error listing artifacts in s3://{bucket}/{prefix}: {e}")
+        logger.error("Error listing artifacts in s3://%s/%s: %s", bucket, prefix, e)
         return []
 
 
@@ -166,18 +249,50 @@ def delete_artifact(bucket: str, key: str) -> bool:
         client = get_minio_client()
 
         client.delete_object(Bucket=bucket, Key=key)
-        print(f"Deleted artifact: s3://{bucket}/{key}")
+        logger.debug("Deleted artifact: s3://%s/%s", bucket, key)
         return True
 
     except Exception as e:
-        print(f"Error deleting artifact s3://{bucket}/{key}: {e}")
+        logger.error("Error deleting artifact s3://%s/%s: %s", bucket, key, e)
         return False
 
 
+def _delete_batch(bucket: str, keys: list[str]) -> int:
+    """Delete up to _PAGE_SIZE keys in one request, returning how many were removed."""
+    try:
+        client = get_minio_client()
+
+        # Quiet mode lists only the keys that failed.
+        response = client.delete_objects(
+            Bucket=bucket,
+            Delete={"Objects": [{"Key": key} for key in keys], "Quiet": True},
+        )
+        errors = response.get("Errors", [])
+        for error in errors:
+            logger.error(
+                "Error deleting artifact s3://%s/%s: %s %s",
+                bucket,
+                error.get("Key"),
+                error.get("Code"),
+                error.get("Message"),
+            )
+        return len(keys) - len(errors)
+
+    except Exception as e:
+        logger.error("Error deleting %d artifacts from s3://%s: %s", len(keys), bucket, e)
+        return 0
+
+
+def _utc_timestamp() -> str:
+    """Return the current UTC time as YYYY-MM-DDTHH:MM:SSZ."""
+    return datetime.now(UTC).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+
 def publish_ruleset(
     ruleset_data: dict,
     bucket: str | None = None,
     run_id: str | None = None,
+    published_at: str | None = None,
 ) -> str | None:
     """
     Publish a ruleset to MinIO using standard rule management paths.
@@ -190,12 +305,13 @@ def publish_ruleset(
         ruleset_data: Ruleset dictionary with keys: ruleset_key, country, version, environment
         bucket: S3 bucket name
         run_id: Optional run ID for metadata tagging
+        published_at: Optional UTC publish time (YYYY-MM-DDTHH:MM:SSZ); defaults to now
 
     Returns:
         S3 key of published ruleset artifact or None if error
     """
     if run_id is None:
-        run_id = str(uuid4())[:8]
+        run_id = os.urandom(4).hex()
 
     if bucket is None:
         bucket = os.getenv("S3_BUCKET_NAME", "fraud-gov-artifacts")
@@ -212,7 +328,7 @@ def publish_ruleset(
     manifest_key = f"rulesets/{environment}/{country}/{ruleset_key}/manifest.json"
 
     # Add metadata (ISO 8601 format for compatibility with Jackson Instant deserialization)
-    timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+    timestamp = published_at or _utc_timestamp()
     metadata = {
         "run_id": run_id,
         "ruleset_key": ruleset_key,
@@ -223,12 +339,12 @@ def publish_ruleset(
         "source": "load-test",
     }
 
-    # Calculate SHA-256 checksum of ruleset artifact
-    ruleset_json = json.dumps(ruleset_data, indent=2).encode("utf-8")
+    # Serialize once so the SHA-256 checksum covers exactly the uploaded bytes
+    ruleset_json = dumps(ruleset_data)
     checksum = hashlib.sha256(ruleset_json).hexdigest()
 
     # Upload ruleset artifact
-    if not upload_artifact(bucket, artifact_key, ruleset_data, metadata):
+    if not upload_artifact(bucket, artifact_key, ruleset_json, metadata):
         return None
 
     # Generate manifest.json content (matches rule management schema)
@@ -247,13 +363,46 @@ def publish_ruleset(
 
     # Upload manifest.json pointer
     if not upload_artifact(bucket, manifest_key, manifest_content, metadata):
-        print(f"Warning: Failed to upload manifest for {ruleset_key}")
+        logger.warning("Failed to upload manifest for %s", ruleset_key)
         return artifact_key  # Return artifact key even if manifest fails
 
-    print(f"Published ruleset: {ruleset_key} v{version} for country={country}")
+    logger.info("Published ruleset: %s v%s for country=%s", ruleset_key, version, country)
     return artifact_key
 
 
+def publish_rulesets(
+    rulesets: list[dict],
+    bucket: str | None = None,
+    run_id: str | None = None,
+) -> list[str | None]:
+    """
+    Publish several rulesets concurrently under one run ID and publish time.
+
+    Args:
+        rulesets: Ruleset dictionaries, as accepted by publish_ruleset
+        bucket: S3 bucket name
+        run_id: Optional run ID for metadata tagging
+
+    Returns:
+        S3 key of each published ruleset artifact, or None where it failed,
+        in the order of rulesets
+    """
+    if not rulesets:
+        return []
+
+    if run_id is None:
+        run_id = os.urandom(4).hex()
+
+    published_at = _utc_timestamp()
+    with ThreadPoolExecutor(max_workers=min(_PUBLISH_WORKERS, len(rulesets))) as pool:
+        return list(
+            pool.map(
+                lambda ruleset: publish_ruleset(ruleset, bucket, run_id, published_at),
+                rulesets,
+            )
+        )
+
+
 def cleanup_run_artifacts(bucket: str, run_id: str) -> int:
     """
     Clean up all artifacts for a specific run.
@@ -269,17 +418,20 @@ def cleanup_run_artifacts(bucket: str, run_id: str) -> int:
     # Current ruleset publishing uses canonical rule-management keys under rulesets/...
     # (which are overwritten across runs), so run-scoped cleanup generally deletes 0 objects.
     prefix = f"loadtest/{run_id}/"
-    keys = list_artifacts(bucket, prefix)
 
-    deleted_count = 0
-    for key in keys:
-        if delete_artifact(bucket, key):
-            deleted_count += 1
+    # Each listed page becomes one DeleteObjects request, sent while the next
+    # page is fetched, so the full key list is never held in memory.
+    futures = []
+    try:
+        with ThreadPoolExecutor(max_workers=_DELETE_WORKERS) as pool:
+            for keys in _iter_key_pages(bucket, prefix):
+                if keys:
+                    futures.append(pool.submit(_delete_batch, bucket, keys))
+    except Exception as e:
+        logger.error("Error listing artifacts in s3://%s/%s: %s", bucket, prefix, e)
+    deleted_count = sum(future.result() for future in futures)
 
-    print(
-        f"Cleaned up {deleted_count} artifacts for run {run_id} "
-        f"(prefix {prefix})"
-    )
+    logger.info("Cleaned up %d artifacts for run %s (prefix %s)", deleted_count, run_id, prefix)
     return deleted_count
 
 
@@ -302,6 +454,35 @@ def verify_artifact_exists(bucket: str, key: str) -> bool:
         return False
 
 
+def verify_artifacts_exist(bucket: str, keys: Iterable[str]) -> dict[str, bool]:
+    """
+    Check several artifacts with one paginated listing instead of a HEAD per key.
+
+    Lists the keys' longest common prefix and stops as soon as every key has
+    been seen.
+
+    Args:
+        bucket: S3 bucket name
+        keys: Object keys/paths
+
+    Returns:
+        Mapping of each key to whether it exists
+    """
+    keys = list(keys)
+    missing = set(keys)
+    if missing:
+        prefix = os.path.commonprefix(keys)
+        try:
+            for key in iter_artifacts(bucket, prefix):
+                missing.discard(key)
+                if not missing:
+                    break
+        except Exception as e:
+            logger.error("Error listing artifacts in s3://%s/%s: %s", bucket, prefix, e)
+            missing = set(keys)
+    return {key: key not in missing for key in keys}
+
+
 def get_run_artifacts(bucket: str, run_id: str, artifact_type: str = "rulesets") -> list:
     """
     Get all artifacts of a specific type for a run.
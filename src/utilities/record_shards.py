@@ -0,0 +1,111 @@
+"""
+Stream generated fixture records to disk, optionally across worker processes.
+
+Used by the gen-users and gen-transactions scripts. In parallel mode each
+worker writes a fragment file for its slice of the count, and the fragments
+are joined with merge_record_parts.
+"""
+
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+try:
+    # Package-style imports (used by console script entry points).
+    from src.utilities.jsonio import RecordWriter, merge_record_parts
+except ModuleNotFoundError:
+    # Backward-compatible imports when running with src on PYTHONPATH.
+    from utilities.jsonio import RecordWriter, merge_record_parts
+
+# Generator called as generate(count, seed=seed); must be picklable for workers.
+RecordSource = Callable[..., Iterable[dict]]
+
+
+def write_records(
+    output_path: Path,
+    generate: RecordSource,
+    count: int,
+    seed: int | None,
+    jsonl: bool,
+    pretty: bool,
+    workers: int = 1,
+    tally: str | None = None,
+) -> tuple[int, Counter, dict | None]:
+    """
+    Write count generated records to output_path.
+
+    Args:
+        output_path: JSON or JSON Lines file to write
+        generate: Record generator, e.g. functools.partial(iter_users, country="US")
+        count: Number of records
+        seed: Base seed; each shard offsets it by its first record's index
+        jsonl: Write JSON Lines rather than one JSON array
+        pretty: Indent JSON array output
+        workers: Worker processes; 1 writes in this process
+        tally: Record field whose values are counted
+
+    Returns:
+        (records written, counts of the tally field, first record)
+    """
+    if workers > 1:
+        return _write_parallel(output_path, generate, count, seed, jsonl, pretty, workers, tally)
+    return _write_shard(str(output_path), generate, count, seed, jsonl, pretty, tally)
+
+
+def _write_shard(
+    path: str,
+    generate: RecordSource,
+    count: int,
+    seed: int | None,
+    jsonl: bool,
+    pretty: bool,
+    tally: str | None,
+    fragment: bool = False,
+) -> tuple[int, Counter, dict | None]:
+    """Stream records to a file, returning (written, tally counts, sample)."""
+    counts = Counter()
+    sample = None
+    with RecordWriter(path, jsonl=jsonl, indent=pretty, fragment=fragment) as writer:
+        for record in generate(count, seed=seed):
+            writer.write(record)
+            if tally:
+                counts[record[tally]] += 1
+            if sample is None:
+                sample = record
+    return writer.count, counts, sample
+
+
+def _write_parallel(
+    output_path: Path,
+    generate: RecordSource,
+    count: int,
+    seed: int | None,
+    jsonl: bool,
+    pretty: bool,
+    workers: int,
+    tally: str | None,
+) -> tuple[int, Counter, dict | None]:
+    """Generate shards in worker processes, then concatenate the part files."""
+    shard_size = -(-count // workers)
+    shards = []
+    for idx, offset in enumerate(range(0, count, shard_size)):
+        part = output_path.with_name(f"{output_path.stem}.part_{idx}{output_path.suffix}")
+        shard_seed = seed + idx * shard_size if seed is not None else None
+        shards.append((part, min(shard_size, count - offset), shard_seed))
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(
+                _write_shard, str(part), generate, size, shard_seed, jsonl, pretty, tally, True
+            )
+            for part, size, shard_seed in shards
+        ]
+        results = [future.result() for future in futures]
+
+    merge_record_parts(output_path, [part for part, _, _ in shards], jsonl=jsonl, indent=pretty)
+
+    counts = Counter()
+    for _, shard_counts, _ in results:
+        counts.update(shard_counts)
+    return sum(written for written, _, _ in results), counts, results[0][2]
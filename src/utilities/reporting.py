@@ -7,10 +7,74 @@ Generates HTML reports, CSV exports, and run summaries.
 import csv
 import html
 import json
-from dataclasses import asdict, dataclass
+import os
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
 
+from locust.runners import WorkerRunner
+
+from utilities.jsonio import read_json, write_json
+
+# Percentiles written to the per-run percentile summary.
+SUMMARY_PERCENTILES = (0.50, 0.90, 0.95, 0.99, 0.999)
+
+_HTML_ROW = """
+                <tr class="{row_class}">
+                    <td>{run_id}</td>
+                    <td>{scenario}</td>
+                    <td>{total_requests}</td>
+                    <td>{total_failures}</td>
+                    <td>{p95:.2f} ms</td>
+                    <td>{p99:.2f} ms</td>
+                    <td>{rps:.2f}</td>
+                    <td class="{row_class}">{pass_fail}</td>
+                </tr>
+            """
+
+_HTML_HEAD = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Load Test Report</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; margin: 20px; }}
+        table {{ border-collapse: collapse; width: 100%; }}
+        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
+        th {{ background-color: #4CAF50; color: white; }}
+        tr:nth-child(even) {{ background-color: #f2f2f2; }}
+        .pass {{ color: green; font-weight: bold; }}
+        .fail {{ color: red; font-weight: bold; }}
+        h1 {{ color: #333; }}
+        .summary {{ margin-bottom: 20px; padding: 10px; background-color: #f9f9f9; }}
+    </style>
+</head>
+<body>
+    <h1>Load Test Report</h1>
+    <div class="summary">
+        <p>Generated: {generated}</p>
+        <p>Total Runs: {total_runs}</p>
+    </div>
+    <table>
+        <tr>
+            <th>Run ID</th>
+            <th>Scenario</th>
+            <th>Requests</th>
+            <th>Failures</th>
+            <th>P95 Latency</th>
+            <th>P99 Latency</th>
+            <th>RPS</th>
+            <th>Status</th>
+        </tr>
+        """
+
+_HTML_TAIL = """
+    </table>
+</body>
+</html>
+        """
+
 
 @dataclass
 class RunSummary:
@@ -90,6 +154,11 @@ class ReportGenerator:
         # Generate CSV
         self._write_csv_summary(summary)
 
+        # Per-endpoint percentiles; workers skip this and leave it to the master,
+        # which holds the merged histograms.
+        if not isinstance(environment.runner, WorkerRunner):
+            self._write_percentiles(stats)
+
         print(f"Report generated: {self.output_dir}/run-summary-{summary.run_id}.json")
         print(f"Pass/Fail: {pass_fail}")
 
@@ -97,112 +166,100 @@ class ReportGenerator:
         """Write JSON summary file."""
         output_file = self.output_dir / f"run-summary-{summary.run_id}.json"
 
-        data = asdict(summary)
-        # Convert datetime objects to strings
-        data["start_time"] = summary.start_time.isoformat()
-        data["end_time"] = summary.end_time.isoformat() if summary.end_time else None
+        # Serialized straight from the dataclass; datetimes become ISO-8601 strings
+        write_json(output_file, summary, indent=True)
 
-        with open(output_file, "w") as f:
-            json.dump(data, f, indent=2)
+    def _write_percentiles(self, stats) -> Path:
+        """
+        Write per-endpoint latency percentiles from Locust's response time histograms.
+
+        Locust keeps a bucketed histogram per endpoint as requests complete, so
+        this summary is read straight from memory instead of re-parsing CSVs.
+        Written under runs/<LOADTEST_RUN_ID>/ when the runner set a run ID.
+        """
+        run_id = os.getenv("LOADTEST_RUN_ID")
+        output_dir = self.output_dir / "runs" / run_id if run_id else self.output_dir
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / "percentiles.json"
+
+        endpoints = {}
+        for entry in [*stats.entries.values(), stats.total]:
+            if not entry.num_requests:
+                continue
+            name = "Aggregated" if entry is stats.total else f"{entry.method} {entry.name}"
+            endpoints[name] = {
+                "requests": entry.num_requests,
+                "failures": entry.num_failures,
+                "percentiles_ms": {
+                    f"p{p * 100:g}": entry.get_response_time_percentile(p)
+                    for p in SUMMARY_PERCENTILES
+                },
+            }
+
+        write_json(output_file, endpoints, indent=True)
+
+        return output_file
 
     def _write_csv_summary(self, summary: RunSummary):
         """Write CSV summary file."""
         output_file = self.output_dir / f"run-summary-{summary.run_id}.csv"
 
+        rows = [
+            ("Metric", "Value"),
+            ("Run ID", summary.run_id),
+            ("Start Time", summary.start_time.isoformat()),
+            ("End Time", summary.end_time.isoformat() if summary.end_time else "N/A"),
+            ("Total Requests", summary.total_requests),
+            ("Total Failures", summary.total_failures),
+            ("Avg Response Time (ms)", f"{summary.avg_response_time_ms:.2f}"),
+            ("P95 Response Time (ms)", f"{summary.p95_response_time_ms:.2f}"),
+            ("P99 Response Time (ms)", f"{summary.p99_response_time_ms:.2f}"),
+            ("RPS", f"{summary.rps:.2f}"),
+            ("Pass/Fail", summary.pass_fail),
+        ]
         with open(output_file, "w", newline="") as f:
-            writer = csv.writer(f)
-            writer.writerow(["Metric", "Value"])
-            writer.writerow(["Run ID", summary.run_id])
-            writer.writerow(["Start Time", summary.start_time.isoformat()])
-            writer.writerow(
-                ["End Time", summary.end_time.isoformat() if summary.end_time else "N/A"]
-            )
-            writer.writerow(["Total Requests", summary.total_requests])
-            writer.writerow(["Total Failures", summary.total_failures])
-            writer.writerow(["Avg Response Time (ms)", f"{summary.avg_response_time_ms:.2f}"])
-            writer.writerow(["P95 Response Time (ms)", f"{summary.p95_response_time_ms:.2f}"])
-            writer.writerow(["P99 Response Time (ms)", f"{summary.p99_response_time_ms:.2f}"])
-            writer.writerow(["RPS", f"{summary.rps:.2f}"])
-            writer.writerow(["Pass/Fail", summary.pass_fail])
+            csv.writer(f).writerows(rows)
 
     def generate_combined_report(self, run_ids: list[str]) -> Path:
         """Generate a combined report from multiple runs."""
         output_file = self.output_dir / "combined" / "index.html"
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        # Load all summaries
-        summaries = []
-        for run_id in run_ids:
-            summary_file = self.output_dir / f"run-summary-{run_id}.json"
-            if summary_file.exists():
-                with open(summary_file) as f:
-                    summaries.append(json.load(f))
-
-        # Generate HTML
-        html_content = self._generate_html_report(summaries)
+        summary_files = [
+            summary_file
+            for run_id in run_ids
+            if (summary_file := self.output_dir / f"run-summary-{run_id}.json").exists()
+        ]
 
+        # Stream the page: each summary is loaded and written as its row is reached
+        summaries = (read_json(summary_file) for summary_file in summary_files)
         with open(output_file, "w") as f:
-            f.write(html_content)
+            f.writelines(self._iter_html_report(summaries, len(summary_files)))
 
         return output_file
 
     def _generate_html_report(self, summaries: list[dict]) -> str:
         """Generate HTML report content."""
-        rows = []
-        for s in summaries:
-            row_class = "pass" if s.get("pass_fail") == "PASS" else "fail"
-            rows.append(f"""
-                <tr class="{row_class}">
-                    <td>{html.escape(s.get("run_id", "N/A"))}</td>
-                    <td>{html.escape(s.get("scenario", "N/A"))}</td>
-                    <td>{s.get("total_requests", 0)}</td>
-                    <td>{s.get("total_failures", 0)}</td>
-                    <td>{s.get("p95_response_time_ms", 0):.2f} ms</td>
-                    <td>{s.get("p99_response_time_ms", 0):.2f} ms</td>
-                    <td>{s.get("rps", 0):.2f}</td>
-                    <td class="{row_class}">{html.escape(s.get("pass_fail", "UNKNOWN"))}</td>
-                </tr>
-            """)
+        return "".join(self._iter_html_report(summaries, len(summaries)))
 
-        return f"""
-<!DOCTYPE html>
-<html>
-<head>
-    <title>Load Test Report</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; margin: 20px; }}
-        table {{ border-collapse: collapse; width: 100%; }}
-        th, td {{ border: 1px solid #ddd; padding: 8px; text-align: left; }}
-        th {{ background-color: #4CAF50; color: white; }}
-        tr:nth-child(even) {{ background-color: #f2f2f2; }}
-        .pass {{ color: green; font-weight: bold; }}
-        .fail {{ color: red; font-weight: bold; }}
-        h1 {{ color: #333; }}
-        .summary {{ margin-bottom: 20px; padding: 10px; background-color: #f9f9f9; }}
-    </style>
-</head>
-<body>
-    <h1>Load Test Report</h1>
-    <div class="summary">
-        <p>Generated: {datetime.now().isoformat()}</p>
-        <p>Total Runs: {len(summaries)}</p>
-    </div>
-    <table>
-        <tr>
-            <th>Run ID</th>
-            <th>Scenario</th>
-            <th>Requests</th>
-            <th>Failures</th>
-            <th>P95 Latency</th>
-            <th>P99 Latency</th>
-            <th>RPS</th>
-            <th>Status</th>
-        </tr>
-        {"".join(rows)}
-    </table>
-</body>
-</html>
-        """
+    def _iter_html_report(self, summaries: Iterable[dict], total_runs: int) -> Iterator[str]:
+        """Yield the HTML report header, one chunk per summary row, then the footer."""
+        yield _HTML_HEAD.format(generated=datetime.now().isoformat(), total_runs=total_runs)
+        for s in summaries:
+            yield _HTML_ROW.format_map(
+                {
+                    "row_class": "pass" if s.get("pass_fail") == "PASS" else "fail",
+                    "run_id": html.escape(s.get("run_id", "N/A")),
+                    "scenario": html.escape(s.get("scenario", "N/A")),
+                    "total_requests": s.get("total_requests", 0),
+                    "total_failures": s.get("total_failures", 0),
+                    "p95": s.get("p95_response_time_ms", 0),
+                    "p99": s.get("p99_response_time_ms", 0),
+                    "rps": s.get("rps", 0),
+                    "pass_fail": html.escape(s.get("pass_fail", "UNKNOWN")),
+                }
+            )
+        yield _HTML_TAIL
 
     def export_to_json(self, data: dict, filename: str):
         """Export arbitrary data to JSON."""
@@ -0,0 +1,64 @@
+"""
+Per-run descriptor shared by the runner script and the locustfile.
+
+The runner writes the service selection for a run to
+html-reports/runs/<run_id>/config.json; every Locust process reads it once at
+startup. This module only depends on jsonio so the locustfile can import it
+without pulling in the seeding harness and its S3 client.
+"""
+
+import os
+from pathlib import Path
+
+try:
+    # Package-style imports (used by console script entry points).
+    from src.utilities.jsonio import read_json, write_json
+except ModuleNotFoundError:
+    # Backward-compatible imports when running with src on PYTHONPATH.
+    from utilities.jsonio import read_json, write_json
+
+
+def run_descriptor_path(run_id: str, output_dir: str = "html-reports") -> Path:
+    """Get the path of the descriptor the locustfile reads for a run."""
+    return Path(output_dir) / "runs" / run_id / "config.json"
+
+
+def write_run_descriptor(run_id: str, settings: dict, output_dir: str = "html-reports") -> Path:
+    """
+    Write the service selection for a run so Locust can read it once at startup.
+
+    Args:
+        run_id: Run ID the descriptor belongs to
+        settings: Service toggles and rule-engine mode for the run
+        output_dir: Base directory for run artifacts
+
+    Returns:
+        Path to descriptor file
+    """
+    descriptor_file = run_descriptor_path(run_id, output_dir)
+    descriptor_file.parent.mkdir(parents=True, exist_ok=True)
+    write_json(descriptor_file, settings, indent=True)
+
+    return descriptor_file
+
+
+def load_run_descriptor(run_id: str | None = None, output_dir: str = "html-reports") -> dict | None:
+    """
+    Load the descriptor written by write_run_descriptor.
+
+    Args:
+        run_id: Run ID to load (defaults to LOADTEST_RUN_ID)
+        output_dir: Base directory for run artifacts
+
+    Returns:
+        Descriptor settings, or None if the run has no descriptor
+    """
+    run_id = run_id or os.getenv("LOADTEST_RUN_ID")
+    if not run_id:
+        return None
+
+    descriptor_file = run_descriptor_path(run_id, output_dir)
+    if not descriptor_file.is_file():
+        return None
+
+    return read_json(descriptor_file)
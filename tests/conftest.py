@@ -0,0 +1,7 @@
+"""Shared pytest configuration."""
+
+import sys
+from pathlib import Path
+
+# Import modules the way the locustfile does, with src on sys.path.
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
@@ -0,0 +1,75 @@
+"""Tests for the streamed JSON record helpers."""
+
+import json
+
+import pytest
+
+from utilities.jsonio import RecordWriter, merge_record_parts, read_records
+
+# Record batches for each part file; empty parts come from shards with no output.
+PART_RECORDS = [
+    [{"id": 1, "name": "alpha"}, {"id": 2, "tags": ["a", "b"]}],
+    [],
+    [{"id": 3, "nested": {"amount": 12.5, "currency": "EUR"}}],
+    [],
+    [{"id": 4, "name": "Müller"}],
+]
+
+MODES = [
+    pytest.param(False, False, "records.json", id="json"),
+    pytest.param(False, True, "records.json", id="pretty"),
+    pytest.param(True, False, "records.jsonl", id="jsonl"),
+]
+
+
+def _write_parts(tmp_path, batches, jsonl, indent):
+    parts = []
+    for i, records in enumerate(batches):
+        part = tmp_path / f"part-{i}"
+        with RecordWriter(part, jsonl=jsonl, indent=indent, fragment=True) as writer:
+            for record in records:
+                writer.write(record)
+        parts.append(part)
+    return parts
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("jsonl", "indent", "filename"), MODES)
+def test_merge_record_parts_round_trips(tmp_path, jsonl, indent, filename):
+    parts = _write_parts(tmp_path, PART_RECORDS, jsonl, indent)
+    output = tmp_path / filename
+
+    merge_record_parts(output, parts, jsonl=jsonl, indent=indent)
+
+    expected = [record for records in PART_RECORDS for record in records]
+    assert read_records(output) == expected
+    assert not any(part.exists() for part in parts)
+    if not jsonl:
+        assert json.loads(output.read_bytes()) == expected
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("jsonl", "indent", "filename"), MODES)
+def test_merge_record_parts_with_only_empty_parts(tmp_path, jsonl, indent, filename):
+    parts = _write_parts(tmp_path, [[], []], jsonl, indent)
+    output = tmp_path / filename
+
+    merge_record_parts(output, parts, jsonl=jsonl, indent=indent)
+
+    assert read_records(output) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("jsonl", "indent", "filename"), MODES)
+def test_merged_output_matches_single_writer(tmp_path, jsonl, indent, filename):
+    parts = _write_parts(tmp_path, PART_RECORDS, jsonl, indent)
+    merged = tmp_path / f"merged-{filename}"
+    merge_record_parts(merged, parts, jsonl=jsonl, indent=indent)
+
+    single = tmp_path / f"single-{filename}"
+    with RecordWriter(single, jsonl=jsonl, indent=indent) as writer:
+        for records in PART_RECORDS:
+            for record in records:
+                writer.write(record)
+
+    assert merged.read_bytes() == single.read_bytes()
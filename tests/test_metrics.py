@@ -0,0 +1,38 @@
+"""Tests for the custom metrics collector."""
+
+import pytest
+
+from utilities.metrics import MetricsCollector, _bucket
+
+
+def _sorted_percentile(samples: list[float], fraction: float) -> float:
+    """Index the sorted samples, as check_thresholds did before the histogram."""
+    ordered = sorted(_bucket(s) for s in samples)
+    n = len(ordered)
+    return ordered[min(int(n * fraction), n - 1)] if n > 0 else 0.0
+
+
+PERCENTILE_CASES = [
+    pytest.param([], (0.5, 0.95, 0.99), id="empty"),
+    pytest.param([42.0], (0.0, 0.5, 0.95, 0.99, 1.0), id="single-sample"),
+    pytest.param([5.0, 1.0, 3.0, 3.0, 9.0, 7.0, 2.0, 2.0, 8.0, 4.0], (0.5, 0.95), id="unsorted"),
+    pytest.param([float(i) for i in range(1, 101)], (0.0, 0.5, 0.95, 0.99, 1.0), id="uniform"),
+    pytest.param([10.0] * 97 + [500.0] * 3, (0.95, 0.96, 0.97, 0.99), id="tail"),
+    pytest.param([12.34, 123.4, 1234.0, 0.5], (0.99, 0.25, 0.5), id="unordered-fractions"),
+    pytest.param([12.3456, 12.3449, 99.99], (0.5, 0.95), id="shared-bucket"),
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(("samples", "fractions"), PERCENTILE_CASES)
+def test_percentiles_match_sorted_samples(samples, fractions):
+    metrics = MetricsCollector()
+    # An error-only metric has a snapshot with no timed observations.
+    metrics.record_error("op")
+    for elapsed_ms in samples:
+        metrics.record_time("op", elapsed_ms)
+    snapshot = metrics.get_stats("op")
+
+    expected = tuple(_sorted_percentile(samples, f) for f in fractions)
+    assert snapshot.percentiles(*fractions) == expected
+    assert tuple(snapshot.percentile(f) for f in fractions) == expected
@@ -0,0 +1,51 @@
+"""Tests for the pre-serialized rule engine payloads."""
+
+import json
+from datetime import datetime
+
+import pytest
+
+from tasksets.rule_engine._common import PayloadRing
+from utilities import jsonio
+
+TEMPLATE = {
+    "transaction_id": None,
+    "card_hash": "card_0a1b2c",
+    "merchant_id": "M12345",
+    "amount": 1234.5,
+    "currency": "USD",
+    "country_code": "US",
+    "merchant_name": "Café Zürich",
+    "timestamp": None,
+}
+SPLICED = ("transaction_id", "timestamp")
+STATIC_FIELDS = {k: v for k, v in TEMPLATE.items() if k not in SPLICED}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """Run a test against both jsonio serializers."""
+    if request.param == "orjson":
+        if jsonio.orjson is None:
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setattr(jsonio, "orjson", None)
+    return request.param
+
+
+@pytest.mark.unit
+def test_payload_ring_splices_transaction_id_and_timestamp(json_backend):
+    payloads = PayloadRing(lambda: dict(TEMPLATE), size=3)
+
+    seen = set()
+    for _ in range(7):
+        body, transaction_id = payloads.next()
+        parsed = jsonio.loads(body)
+        assert parsed == json.loads(body)
+
+        assert parsed["transaction_id"] == transaction_id
+        assert datetime.fromisoformat(parsed["timestamp"]).tzinfo is not None
+        assert {k: v for k, v in parsed.items() if k not in SPLICED} == STATIC_FIELDS
+        seen.add(transaction_id)
+
+    assert len(seen) == 7